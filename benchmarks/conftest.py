@@ -8,6 +8,9 @@ def pytest_benchmark_group_stats(config, benchmarks, group_by):
     outcome = yield
     results = defaultdict(list)
     for bench in benchmarks:
+        if "case" not in (bench["params"] or {}):
+            results[bench["group"] or bench["name"]].append(bench)
+            continue
         case = bench["params"]["case"]
         an = case.adapter_name
         group = bench["name"].replace(an, "").replace(",]", "]").replace("[]", "")
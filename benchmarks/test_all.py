@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 
-from serieux import IncludeFile, Serieux, serialize
+from serieux import IncludeFile, Serieux, Trail, serialize
 
+from .data.tree import Tree
+from .data.world import World, big_world
 from .matrix import Matrix
 
 here = Path(__file__).parent
@@ -42,3 +45,37 @@ def test_deserialize(case, benchmark):
     fn = case.adapter.deserializer_for_type(type(case.data))
     result = benchmark(fn, data_ser)
     assert result == case.data
+
+
+@pytest.mark.parametrize("threads", [1, 4, 16])
+def test_deserialize_threads(threads, benchmark):
+    data = serialize(World, big_world)
+
+    def run():
+        # A new class does not share generated code with the others, so the threads
+        # contend on building it before they all run the compiled path
+        class ThreadedSerieux(Serieux):
+            pass
+
+        deser = ThreadedSerieux().deserialize
+        with ThreadPoolExecutor(threads) as pool:
+            results = list(pool.map(lambda _: deser(World, data), range(threads * 20)))
+        assert all(r == big_world for r in results)
+
+    benchmark(run)
+
+
+def _deep_tree(depth):
+    tree = 0
+    for i in range(depth):
+        tree = Tree(tree, i)
+    return tree
+
+
+@pytest.mark.parametrize("case", ["world", "deep"])
+def test_deserialize_trail(case, benchmark):
+    # Every field and element extends the trail
+    t, value = (World, big_world) if case == "world" else (Tree, _deep_tree(300))
+    data = serialize(t, value)
+    result = benchmark(deserialize, t, data, Trail())
+    assert result == value
@@ -0,0 +1,19 @@
+import subprocess
+import sys
+
+import pytest
+
+
+def run(statement):
+    subprocess.run([sys.executable, "-c", statement], check=True)
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import serieux",
+        "from serieux import deserialize",
+    ],
+)
+def test_import(statement, benchmark):
+    benchmark.pedantic(run, args=(statement,), rounds=5, warmup_rounds=1)
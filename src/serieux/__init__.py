@@ -1,13 +1,14 @@
-import importlib
-import importlib.metadata
 import logging
 import os
 import sys
+import threading
 import traceback
 from functools import partial
+from importlib import import_module
 from pathlib import Path
 from typing import TYPE_CHECKING, TypeAlias
 
+from . import schema as _schema
 from .auto import Auto
 from .ctx import Context, Patch, Patcher, Trail, WorkingDirectory
 from .exc import (
@@ -17,27 +18,26 @@ from .exc import (
     ValidationError,
     display_context_information,
 )
-from .features.clargs import CLIDefinition, CommandLineArguments, parse_cli
-from .features.comment import Comment, CommentRec
-from .features.dotted import DottedNotation
-from .features.fromfile import IncludeFile
-from .features.interpol import Environment
-from .features.lazy import DeepLazy, Lazy
-from .features.partial import AllTrails, Partial, Sources
-from .features.registered import AutoRegistered, Referenced, auto_singleton
-from .features.tagset import ReferencedClass, Tagged, TaggedSubclass, TaggedUnion
 from .impl import BaseImplementation
 from .instructions import Instruction
 from .model import AllowExtras, Field, FieldModelizable, Model, Modelizable, StringModelizable
 from .proxy import LazyProxy
-from .schema import RefPolicy, Schema
 from .utils import JSON, check_signature
 from .version import version as __version__
 
 logger = logging.getLogger("serieux")
 
+RefPolicy = _schema.RefPolicy
+Schema = _schema.Schema
+
+# The import system also binds the submodule as `schema`, but that is the name of the
+# default schema method, which is created lazily. The submodule remains as _schema.
+del schema  # noqa: F821
+
 
 def _default_features():
+    import importlib.metadata
+
     features = []
     eps = importlib.metadata.entry_points(group="serieux.default_features")
     for ep in eps:
@@ -60,11 +60,21 @@ def _default_features():
     return features
 
 
-default_features = _default_features()
-
-
 if TYPE_CHECKING:  # pragma: no cover
-    from typing import TypeVar
+    from typing import Iterable, Iterator, TypeVar
+
+    from .features.clargs import CLIDefinition, CommandLineArguments, parse_cli
+    from .features.columnar import Columnar
+    from .features.comment import Comment, CommentRec
+    from .features.dotted import DottedNotation
+    from .features.fromfile import IncludeFile
+    from .features.interpol import Environment
+    from .features.lazy import DeepLazy, Lazy
+    from .features.partial import AllTrails, ParallelSources, Partial, Sources
+    from .features.profile import Profile
+    from .features.registered import AutoRegistered, Referenced, auto_singleton
+    from .features.reload import Reloader
+    from .features.tagset import ReferencedClass, Tagged, TaggedSubclass, TaggedUnion
 
     T = TypeVar("T")
 
@@ -80,28 +90,124 @@ if TYPE_CHECKING:  # pragma: no cover
 
         def load(self, t: type[T], obj: object, ctx: Context = None) -> T: ...
 
+        def iter_load(self, t: type[T], obj: Path, ctx: Context = None) -> Iterator[T]: ...
+
+        def dump_stream(
+            self, t: type[T], objs: Iterable[object], dest: Path, ctx: Context = None
+        ) -> None: ...
+
         def serialize(self, t: type[T], obj: object, ctx: Context = None) -> JSON: ...
 
         def deserialize(self, t: type[T], obj: object, ctx: Context = None) -> T: ...
 
         def schema(self, t: type[T], ctx: Context = None) -> Schema[str, "JSON"]: ...
 
+        def precompile(
+            self,
+            *types: type,
+            ctx_types: Iterable[type[Context]] = ...,
+            directions: Iterable[str] = ...,
+        ) -> dict[type, dict[str, float]]: ...
+
         def __add__(self, other) -> "Serieux": ...
 
-else:
+    default_features: list[type]
+    serieux = Serieux()
+    serialize = serieux.serialize
+    deserialize = serieux.deserialize
+    schema = serieux.schema
+    load = serieux.load
+    dump = serieux.dump
+    iter_load = serieux.iter_load
+    dump_stream = serieux.dump_stream
+    get_serializer = serieux.get_serializer
+    get_deserializer = serieux.get_deserializer
+    get_batch_serializer = serieux.get_batch_serializer
+    get_batch_deserializer = serieux.get_batch_deserializer
+    precompile = serieux.precompile
+
+
+# Features are imported the first time one of their names is accessed
+_lazy_imports = {
+    "CLIDefinition": ".features.clargs",
+    "CommandLineArguments": ".features.clargs",
+    "parse_cli": ".features.clargs",
+    "Columnar": ".features.columnar",
+    "Comment": ".features.comment",
+    "CommentRec": ".features.comment",
+    "DottedNotation": ".features.dotted",
+    "IncludeFile": ".features.fromfile",
+    "Environment": ".features.interpol",
+    "DeepLazy": ".features.lazy",
+    "Lazy": ".features.lazy",
+    "AllTrails": ".features.partial",
+    "ParallelSources": ".features.partial",
+    "Partial": ".features.partial",
+    "Sources": ".features.partial",
+    "Profile": ".features.profile",
+    "AutoRegistered": ".features.registered",
+    "Referenced": ".features.registered",
+    "auto_singleton": ".features.registered",
+    "Reloader": ".features.reload",
+    "ReferencedClass": ".features.tagset",
+    "Tagged": ".features.tagset",
+    "TaggedSubclass": ".features.tagset",
+    "TaggedUnion": ".features.tagset",
+}
+
+# The default features are found through entry points and the Serieux class is built
+# from them the first time one of these names is accessed, so that importing serieux
+# does not have to import importlib.metadata and every feature's dependencies.
+_lazy_methods = [
+    "serialize",
+    "deserialize",
+    "schema",
+    "load",
+    "dump",
+    "iter_load",
+    "dump_stream",
+    "get_serializer",
+    "get_deserializer",
+    "get_batch_serializer",
+    "get_batch_deserializer",
+    "precompile",
+]
+_lazy_names = {"default_features", "Serieux", "serieux", *_lazy_methods}
+_lazy_lock = threading.Lock()
+
+
+def _make_default():
+    features = _default_features()
+
+    class Serieux(BaseImplementation, *features):
+        __qualname__ = "Serieux"
+
+    srx = Serieux()
+    return {
+        "default_features": features,
+        "Serieux": Serieux,
+        "serieux": srx,
+        **{name: getattr(srx, name) for name in _lazy_methods},
+    }
+
 
-    class Serieux(BaseImplementation, *default_features):
-        pass
+def __getattr__(name):
+    if (module := _lazy_imports.get(name)) is not None:
+        value = globals()[name] = getattr(import_module(module, __name__), name)
+        return value
+    if name not in _lazy_names:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    glb = globals()
+    with _lazy_lock:
+        if "Serieux" not in glb:
+            # Names that were set explicitly, e.g. by monkeypatching, are kept
+            for k, v in _make_default().items():
+                glb.setdefault(k, v)
+    return glb[name]
 
 
-serieux = Serieux()
-serialize = serieux.serialize
-deserialize = serieux.deserialize
-schema = serieux.schema
-load = serieux.load
-dump = serieux.dump
-get_serializer = serieux.get_serializer
-get_deserializer = serieux.get_deserializer
+def __dir__():
+    return sorted({*globals(), *_lazy_names, *_lazy_imports})
 
 
 def serializer(fn=None, priority=0):
@@ -109,7 +215,7 @@ def serializer(fn=None, priority=0):
         return partial(serializer, priority=priority)
 
     check_signature(fn, "serializer", ("self", "t: type[T1]", "obj: T2", "ctx: T3>Context"))
-    Serieux.serialize.register(fn, priority=priority)
+    __getattr__("Serieux").serialize.register(fn, priority=priority)
     return fn
 
 
@@ -118,7 +224,7 @@ def deserializer(fn=None, priority=0):
         return partial(deserializer, priority=priority)
 
     check_signature(fn, "deserializer", ("self", "t: type[T1]", "obj: T2", "ctx: T3>Context"))
-    Serieux.deserialize.register(fn, priority=priority)
+    __getattr__("Serieux").deserialize.register(fn, priority=priority)
     return fn
 
 
@@ -127,7 +233,7 @@ def schema_definition(fn=None, priority=0):
         return partial(schema_definition, priority=priority)
 
     check_signature(fn, "schema definition", ("self", "t: type[T1]", "ctx: T2>Context"))
-    Serieux.schema.register(fn, priority=priority)
+    __getattr__("Serieux").schema.register(fn, priority=priority)
     return fn
 
 
@@ -151,6 +257,7 @@ __all__ = [
     "BaseSerieuxError",
     "CLIDefinition",
     "CommandLineArguments",
+    "Columnar",
     "Comment",
     "CommentRec",
     "Context",
@@ -159,11 +266,15 @@ __all__ = [
     "display_context_information",
     "DottedNotation",
     "dump",
+    "dump_stream",
     "Environment",
     "Field",
+    "get_batch_deserializer",
+    "get_batch_serializer",
     "get_deserializer",
     "get_serializer",
     "IncludeFile",
+    "iter_load",
     "JSON",
     "Lazy",
     "LazyProxy",
@@ -172,14 +283,18 @@ __all__ = [
     "FieldModelizable",
     "Modelizable",
     "Instruction",
+    "ParallelSources",
     "parse_cli",
     "Partial",
     "Patch",
     "Patcher",
+    "precompile",
+    "Profile",
     "RefPolicy",
     "Referenced",
     "ReferencedClass",
     "Registered",
+    "Reloader",
     "schema",
     "Schema",
     "serialize",
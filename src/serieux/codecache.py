@@ -0,0 +1,120 @@
+import hashlib
+import linecache
+import threading
+
+from ovld import MultiTypeMap, Ovld
+from ovld.medley import BuildOvld
+from ovld.version import version as ovld_version
+
+##################
+# ovld internals #
+##################
+
+
+# serieux needs a few parts of ovld that are not in its public API. They are only used
+# in this module, which was written against this ovld version.
+ovld_api_version = (0, 5)
+
+if tuple(int(x) for x in ovld_version.split(".")[:2]) != ovld_api_version:  # pragma: no cover
+    raise ImportError(
+        f"serieux requires ovld {'.'.join(map(str, ovld_api_version))}.x, not {ovld_version}"
+    )
+
+
+def generated_code(fn):
+    """Return the Def or Lambda that fn was generated from, or None."""
+    return getattr(fn, "__codegen__", None)
+
+
+def inline_expression(cg, args):
+    """Return the expression of a Lambda applied to args, to inline in other code.
+
+    Raises ValueError if cg is a Def, which cannot be inlined.
+    """
+    return cg.create_expression(args)
+
+
+def dispatch_map(method):
+    """Return the type map an ovld dispatches through.
+
+    The map is only created once the ovld is compiled, which may not have happened
+    yet, e.g. for the class that code is being generated for.
+    """
+    ov = method.__ovld__
+    ov.ensure_compiled()
+    return ov.map
+
+
+##################
+# Generated code #
+##################
+
+
+def instantiate_code(symbol, code, inject={}):  # noqa: B006
+    # Register the code under a virtual file name, so that tracebacks can show it
+    virtual_file = f"<ovld:{hashlib.sha256(code.encode()).hexdigest()[:16]}>"
+    linecache.cache[virtual_file] = (None, None, code.splitlines(True), virtual_file)
+    glb = {**inject}
+    exec(compile(source=code, filename=virtual_file, mode="exec"), glb, glb)
+    return glb[symbol]
+
+
+###########
+# Locking #
+###########
+
+
+class LockedTypeMap(MultiTypeMap):
+    """MultiTypeMap that resolves each tuple of types under a lock for that tuple.
+
+    Types that were already resolved are looked up without locking. Code generators
+    only resolve types that are simpler than the one they generate code for, so the
+    locks of different entries are always taken in the same order.
+    """
+
+    def __missing__(self, obj_t_tup):
+        with self.entry_locks.setdefault(obj_t_tup, threading.RLock()):
+            # Another thread may have resolved these types while we were waiting
+            if (method := self.get(obj_t_tup)) is not None:
+                return method
+            return super().__missing__(obj_t_tup)
+
+
+class LockedOvld(Ovld):
+    """Ovld that compiles under its own lock and dispatches through a LockedTypeMap."""
+
+    def __init__(self, *args, **kwargs):
+        self.compile_lock = threading.RLock()
+        self._locked_map = False
+        super().__init__(*args, **kwargs)
+
+    def ensure_compiled(self):
+        if not self._locked_map:
+            self.compile()
+
+    def compile(self):
+        with self.compile_lock:
+            if self._locked_map:
+                return
+            super().compile()
+            # The dispatch and the generated code refer to the map that ovld made, so
+            # that map is turned into a LockedTypeMap rather than replaced
+            self.map.entry_locks = {}
+            self.map.__class__ = LockedTypeMap
+            self._locked_map = True
+
+    def invalidate(self):
+        self._locked_map = False
+        super().invalidate()
+
+    def copy(self, mixins=[], linkback=False):
+        return LockedOvld(mixins=[self, *mixins], linkback=linkback)
+
+
+def locked_ovld(name):
+    """Combiner for a Medley method built as a LockedOvld.
+
+    Copies of the class, e.g. made by adding features to it or by setting codegen
+    parameters, copy the LockedOvld.
+    """
+    return BuildOvld(name, LockedOvld(name=name, linkback=True))
@@ -31,15 +31,85 @@ class OmitDefaults(Context):
     pass
 
 
+class Trusted(Context):
+    """Skip the validation of the input, which must already have the right types."""
+
+
+class Binary(Context):
+    """The serialized data will be written in a format that can store raw buffers."""
+
+
+class TrailNode:
+    """Link in a trail, pointing to its parent so that extending a trail is O(1).
+
+    The trail as a tuple of entries is only built when it is asked for.
+    """
+
+    __slots__ = ("parent", "entry", "_full", "_keys")
+
+    def __init__(self, parent, entry):
+        self.parent = parent
+        self.entry = entry
+        self._full = None
+        self._keys = None
+
+    @property
+    def full(self):
+        if self._full is None:
+            self._full = (*(self.parent.full if self.parent else ()), self.entry)
+        return self._full
+
+    @property
+    def keys(self):
+        if self._keys is None:
+            self._keys = (*(self.parent.keys if self.parent else ()), self.entry[2])
+        return self._keys
+
+    def __eq__(self, other):
+        return isinstance(other, TrailNode) and self.full == other.full
+
+    __hash__ = None
+
+    def __repr__(self):  # pragma: no cover
+        return f"TrailNode{self.full!r}"
+
+
+class FullTrail:
+    """Descriptor for Trail.full_trail, which is computed from the trail node when read.
+
+    Setting it, e.g. with Trail(full_trail=...) or replace(), rebuilds the nodes. The
+    descriptor is its own default, which, like None, keeps the node that was given.
+    """
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return obj.trail_node.full if obj.trail_node else ()
+
+    def __set__(self, obj, value):
+        if value is not None and value is not self:
+            node = None
+            for entry in value:
+                node = TrailNode(node, entry)
+            obj.trail_node = node
+
+
 class Trail(Context):
-    full_trail: tuple = ()
+    trail_node: TrailNode = field(default=None, repr=False, compare=False)
+    # Must come after trail_node, so that it has precedence when both are given
+    full_trail: tuple = FullTrail()
 
     @property
     def trail(self):
-        return tuple(k for _, _, k in self.full_trail)
+        return self.trail_node.keys if self.trail_node else ()
 
     def follow(self, objt, obj, field):
-        return replace(self, full_trail=(*self.full_trail, (objt, obj, field)))
+        # The child is a copy that skips __init__ and __post_init__, which would not
+        # change anything, but cost more than the rest of follow
+        child = object.__new__(type(self))
+        child.__dict__.update(self.__dict__)
+        child.trail_node = TrailNode(self.trail_node, (objt, obj, field))
+        return child
 
 
 @dataclass
@@ -1,6 +1,7 @@
 import re
 import sys
 from dataclasses import dataclass, field
+from functools import cached_property
 
 from ovld import ovld
 from ovld.medley import ABSENT
@@ -82,8 +83,8 @@ def extract_information(ctx=None, frame=None):
             if obj1 is not obj2 and isinstance(obj1, FileSource):
                 try:
                     fp = obj1.field.split(".") if obj1.field else []
-                    loc = obj1.format.locate(obj1.path, [*fp, *ci.path])
-                    ci.locs.insert(0, loc)
+                    if loc := obj1.format.locate(obj1.path, [*fp, *ci.path]):
+                        ci.locs.insert(0, loc)
                 except FileNotFoundError:
                     pass
             above = t1, obj1
@@ -189,8 +190,22 @@ class BaseSerieuxError(Exception):
 class SerieuxError(BaseSerieuxError):
     def __init__(self, message=None, *, ctx=None):
         super().__init__(message)
-        self.info = extract_information(ctx)
-        self.ctx = self.info.ctx
+        self._ctx = ctx
+        # Errors are often caught and discarded, so the stack is only walked if the
+        # information is needed. Until then, keep a reference to the frame.
+        self._frame = None if isinstance(ctx, Trail) else sys._getframe()
+
+    @cached_property
+    def info(self):
+        info = extract_information(self._ctx, self._frame)
+        self._frame = None
+        return info
+
+    @property
+    def ctx(self):
+        if isinstance(self._ctx, Trail):
+            return self._ctx
+        return self.info.ctx
 
     @property
     def message(self):
@@ -1,12 +1,42 @@
-from .autotag import AutoTagAny
-from .clargs import FromArguments
-from .comment import CommentedObjects
-from .dotted import DottedNotation
-from .fromfile import FromFile, IncludeFile
-from .interpol import Interpolation
-from .lazy import LazyDeserialization
-from .partial import PartialBuilding
-from .tagset import TagSetFeature
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .autotag import AutoTagAny
+    from .clargs import FromArguments
+    from .comment import CommentedObjects
+    from .dotted import DottedNotation
+    from .fromfile import FromFile, IncludeFile
+    from .interpol import Interpolation
+    from .lazy import LazyDeserialization
+    from .partial import PartialBuilding
+    from .tagset import TagSetFeature
+
+# Importing one feature does not import the others
+_lazy_imports = {
+    "AutoTagAny": ".autotag",
+    "CommentedObjects": ".comment",
+    "DottedNotation": ".dotted",
+    "FromArguments": ".clargs",
+    "FromFile": ".fromfile",
+    "IncludeFile": ".fromfile",
+    "Interpolation": ".interpol",
+    "LazyDeserialization": ".lazy",
+    "PartialBuilding": ".partial",
+    "TagSetFeature": ".tagset",
+}
+
+
+def __getattr__(name):
+    if (module := _lazy_imports.get(name)) is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = getattr(import_module(module, __name__), name)
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_lazy_imports})
+
 
 __all__ = [
     "AutoTagAny",
@@ -0,0 +1,282 @@
+import math
+from array import array
+from dataclasses import MISSING, dataclass
+from itertools import repeat
+from typing import TYPE_CHECKING, Annotated, Any, TypeAlias, get_args
+
+from ovld import Code, Def, Medley, code_generator, ovld, recurse
+
+from ..ctx import Context, Trail
+from ..exc import (
+    MissingFieldError,
+    SchemaError,
+    SerieuxError,
+    UnrecognizedFieldError,
+    ValidationError,
+)
+from ..instructions import BaseInstruction, T, strip
+from ..model import model
+from ..priority import HI3
+from ..utils import clsstring
+
+#############
+# Constants #
+#############
+
+
+# array typecodes for the columns of numbers, if arrays=True
+_typecodes = {int: "q", float: "d"}
+
+
+class _NOT_GIVEN:
+    pass
+
+
+@dataclass(frozen=True)
+class _Columnar(BaseInstruction):
+    # Serialize columns of ints and floats as array.array
+    arrays: bool = False
+
+    def __getitem__(self, t):
+        return Annotated[t, self]
+
+    def __call__(self, *args, **kwargs):
+        return type(self)(*args, **kwargs)
+
+
+if TYPE_CHECKING:
+    Columnar: TypeAlias = Annotated[T, None]
+else:
+    Columnar = _Columnar()
+
+
+def _element_model(t):
+    instr = _Columnar.extract(t)
+    lst = strip(t, _Columnar)
+    if (lm := model(lst)) is None or lm.element_field is None:
+        raise SchemaError(f"Columnar only applies to lists, not '{clsstring(lst)}'")
+    et = lm.element_field.type
+    if (em := model(et)) is None or em.fields is None:
+        raise SchemaError(f"Columnar elements must have fields, which '{clsstring(et)}' does not")
+    return instr, lm, em
+
+
+def _columns(t, obj, expected, typecodes, allow_extras, ctx):
+    if not allow_extras and not (obj.keys() <= expected):
+        raise UnrecognizedFieldError(t, expected, obj.keys(), ctx=ctx)
+    columns = obj
+    lengths = set()
+    for k in expected:
+        if k in obj:
+            col = obj[k]
+            # Columns dumped with arrays=True come back as bytes from binary formats
+            if isinstance(col, bytes | bytearray | memoryview) and (tc := typecodes.get(k)):
+                raw, col = col, array(tc)
+                try:
+                    col.frombytes(raw)
+                except ValueError as exc:
+                    raise ValidationError(exc=exc, ctx=ctx)
+                if columns is obj:
+                    columns = dict(obj)
+                columns[k] = col
+            elif not isinstance(col, list | tuple | array):
+                raise ValidationError(f"Column '{k}' should be a list", ctx=ctx)
+            lengths.add(len(col))
+    if len(lengths) > 1:
+        raise ValidationError(f"All columns should have the same length, not {lengths}", ctx=ctx)
+    return (lengths.pop() if lengths else 0), columns
+
+
+def _locate_row_error(impl, et, fields, columns, n, ctx):
+    # Deserialize the rows again one value at a time with a trail, so that the first
+    # error is reported along with its column and row
+    ctx = ctx + Trail()
+    for i in range(n):
+        for name, ft in fields:
+            if name in columns:
+                col = columns[name]
+                impl.deserialize(ft, col[i], ctx.follow(et, columns, name).follow(list, col, i))
+
+
+def _check_elements(lt, et, obj, ctx):
+    for i, x in enumerate(obj):
+        if not isinstance(x, et):
+            raise ValidationError(
+                f"Cannot serialize object of type '{clsstring(type(x))}'"
+                f" into expected type '{clsstring(et)}'.",
+                ctx=ctx.follow(lt, obj, i) if hasattr(ctx, "follow") else ctx,
+            )
+
+
+###################
+# Implementations #
+###################
+
+
+class ColumnarFeature(Medley):
+    @code_generator(priority=HI3)
+    def serialize(
+        cls, t: type[Any @ _Columnar], obj: list | tuple | set | frozenset, ctx: Context, /
+    ):
+        (t,) = get_args(t)
+        instr, lm, m = _element_model(t)
+        follow = hasattr(ctx, "follow")
+        columns = {}
+        for f in m.fields:
+            if f.property_name is None:
+                raise SchemaError(
+                    f"Cannot serialize '{clsstring(t)}' because its model does not specify how to serialize property '{f.name}'"
+                )
+            ctx_expr = (
+                Code("$ctx.follow($objt, $obj, $fld)", objt=m.original_type, fld=f.name)
+                if follow
+                else Code("$ctx")
+            )
+            body = cls.subcode(
+                "serialize", f.type, Code(f"X.{f.property_name}"), ctx, ctx_expr=ctx_expr
+            )
+            column = Code("[$body for X in $obj]", body=body)
+            if instr.arrays and (tc := _typecodes.get(f.type, None)):
+                column = Code("$array($tc, $column)", array=array, tc=tc, column=column)
+            columns[f.serialized_name] = column
+        # Elements of the wrong type fail on attribute access, and are only looked for then
+        return Def(
+            Code(
+                [
+                    "try:",
+                    ["return {$[, ]items}"],
+                    "except AttributeError:",
+                    ["$check_elements($lt, $et, $obj, $ctx)", "raise"],
+                ],
+                items=[Code("$k: $v", k=k, v=v) for k, v in columns.items()],
+                check_elements=_check_elements,
+                lt=lm.original_type,
+                et=m.original_type,
+            )
+        )
+
+    @code_generator(priority=HI3)
+    def deserialize(cls, t: type[Any @ _Columnar], obj: dict, ctx: Context, /):
+        (t,) = get_args(t)
+        _, lm, m = _element_model(t)
+        follow = hasattr(ctx, "follow")
+
+        def _sortkey(f):
+            return an if isinstance(an := f.argument_name, int) else math.inf
+
+        flds = sorted(m.fields, key=_sortkey)
+        expected = frozenset(f.serialized_name for f in flds if not f.metavar)
+        typecodes = {
+            f.serialized_name: tc
+            for f in flds
+            if not f.metavar and (tc := _typecodes.get(f.type, None))
+        }
+        stmts = [
+            Code(
+                "N, D = $columns($t, $obj, $expected, $typecodes, $allow_extras, $ctx)",
+                columns=_columns,
+                expected=expected,
+                typecodes=typecodes,
+                allow_extras=m.allow_extras,
+            )
+        ]
+        variables = []
+        args = []
+
+        for i, f in enumerate(flds):
+            if isinstance(f.argument_name, str):
+                arg = f"{f.argument_name}=$value"
+            else:
+                arg = "$value"
+            if f.metavar:
+                args.append(Code(arg, value=Code(f.metavar)))
+                continue
+            ctx_expr = (
+                Code(
+                    f"$ctx.follow($objt, D, $fld).follow($list, C_{i}, IDX)",
+                    objt=m.original_type,
+                    fld=f.name,
+                    list=list,
+                )
+                if follow
+                else Code("$ctx")
+            )
+            value = cls.subcode("deserialize", f.type, f"X_{i}", ctx, ctx_expr=ctx_expr)
+            if f.required:
+                stmts.append(
+                    Code(
+                        [
+                            "try:",
+                            [f"C_{i} = D[$name]"],
+                            "except KeyError:",
+                            ["raise $MFE($t, $name, ctx=$ctx)"],
+                        ],
+                        name=f.serialized_name,
+                        MFE=MissingFieldError,
+                    )
+                )
+            else:
+                stmts.append(
+                    Code(
+                        f"C_{i} = D[$name] if $name in D else $repeat($NG, N)",
+                        name=f.serialized_name,
+                        repeat=repeat,
+                        NG=_NOT_GIVEN,
+                    )
+                )
+                if f.default is not MISSING:
+                    dflt = Code("$dflt", dflt=f.default)
+                else:
+                    dflt = Code("$dfltf()", dfltf=f.default_factory)
+                value = Code(
+                    f"($dflt if X_{i} is $NG else $value)", dflt=dflt, value=value, NG=_NOT_GIVEN
+                )
+            variables.append(f"X_{i}")
+            args.append(Code(arg, value=value))
+        if follow:
+            comp = f"for IDX, ({', '.join(variables)},) in enumerate(zip($[, ]cols))"
+        else:
+            comp = f"for {', '.join(variables)}, in zip($[, ]cols)"
+        comp = f"$constructor($[, ]args) {comp}"
+        if lm.from_list is list:
+            code = f"return [{comp}]"
+        elif lm.from_list is set:
+            code = f"return {{{comp}}}"
+        else:
+            code = f"return $from_list([{comp}])"
+        if not follow:
+            # Without a trail, the row of an error is only looked for once it happens
+            code = [
+                "try:",
+                [code],
+                "except $SE:",
+                ["$locate($self, $et, $fields, D, N, $ctx)", "raise"],
+            ]
+        stmts.append(
+            Code(
+                code,
+                constructor=m.constructor,
+                args=args,
+                cols=[Code(v.replace("X", "C")) for v in variables],
+                from_list=lm.from_list,
+                SE=SerieuxError,
+                locate=_locate_row_error,
+                et=m.original_type,
+                fields=tuple((f.serialized_name, f.type) for f in flds if not f.metavar),
+            )
+        )
+        return Def(stmts)
+
+    @ovld(priority=HI3)
+    def schema(self, t: type[Any @ _Columnar], ctx: Context, /):
+        _, _, m = _element_model(t)
+        return {
+            "type": "object",
+            "properties": {
+                f.serialized_name: {"type": "array", "items": recurse(f.type, ctx)}
+                for f in m.fields
+                if not f.metavar
+            },
+            "required": [f.serialized_name for f in m.fields if f.required and not f.metavar],
+            "additionalProperties": m.allow_extras,
+        }
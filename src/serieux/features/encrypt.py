@@ -12,13 +12,8 @@ from ..exc import ValidationError
 from ..instructions import Instruction, T
 from ..priority import STD
 
-try:
+if TYPE_CHECKING:  # pragma: no cover
     from cryptography.fernet import Fernet
-except ImportError:  # pragma: no cover
-    raise ImportError(
-        "The 'cryptography' package is required for encryption features. "
-        "Please install it with 'pip install cryptography'."
-    )
 
 
 #############
@@ -42,7 +37,7 @@ crypt_prefix = "~CRYPT~"
 
 class EncryptionKey(Context):
     password: str | Callable = None
-    fernet_key: Fernet = None
+    fernet_key: "Fernet" = None
 
     def __post_init__(self):
         if callable(self.password):
@@ -50,6 +45,15 @@ class EncryptionKey(Context):
 
     def get_encryption_key(self):
         if self.fernet_key is None:
+            # cryptography is slow to import, so it is only imported when it is needed
+            try:
+                from cryptography.fernet import Fernet
+            except ImportError:  # pragma: no cover
+                raise ImportError(
+                    "The 'cryptography' package is required for encryption features. "
+                    "Please install it with 'pip install cryptography'."
+                )
+
             pw = self.password
             if callable(pw):
                 pw = self.password()
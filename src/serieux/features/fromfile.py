@@ -11,6 +11,7 @@ from ..formats import FileSource
 from ..priority import HI1, MIN, STD5
 from ..utils import clsstring
 from .partial import PartialBuilding, Sources
+from .profile import profiled
 
 include_field = "$include"
 
@@ -24,7 +25,8 @@ class FromFile(PartialBuilding):
         if isinstance(ctx, WorkingDirectory):
             obj = replace(obj, path=ctx.directory / obj.path.expanduser())
         inner_trail = obj.field.split(".") if obj.field else ()
-        data = obj.load()
+        with profiled(ctx, "FromFile", obj.path):
+            data = obj.load()
         ctx = ctx + Sourced(
             origin=obj.path,
             directory=obj.path.parent.absolute(),
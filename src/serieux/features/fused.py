@@ -0,0 +1,144 @@
+import threading
+from collections import OrderedDict
+from dataclasses import MISSING, dataclass, fields, is_dataclass
+from types import NoneType
+from typing import Any, get_args, get_origin
+
+import msgspec
+from ovld import Medley, call_next, ovld, recurse
+
+from ..codecache import generated_code
+from ..ctx import EmptyContext
+from ..formats import FileSource, load_mapped
+from ..formats.json import JSON
+from ..impl import ModelLoader
+from ..model import FieldModelizable, model
+from ..utils import UnionAlias
+from .fromfile import PRIO as FROMFILE_PRIO
+
+
+@dataclass
+class TypedDecoder:
+    # Decodes into msgspec Structs that mirror the models, with unknown fields forbidden
+    decoder: msgspec.json.Decoder
+    # Target type, which the Structs are converted to
+    type: type
+
+    def decode(self, raw):
+        return msgspec.convert(self.decoder.decode(raw), self.type, from_attributes=True)
+
+
+###############
+# struct_spec #
+###############
+
+
+@ovld
+def struct_spec(t: type[list], impl, seen):
+    (et,) = get_args(t) or (object,)
+    es = recurse(et, impl, seen)
+    return None if es is None else list[es]
+
+
+@ovld
+def struct_spec(t: type[dict], impl, seen):
+    kt, vt = get_args(t) or (object, object)
+    vs = recurse(vt, impl, seen) if kt is str else None
+    return None if vs is None else dict[str, vs]
+
+
+@ovld
+def struct_spec(t: type[UnionAlias], impl, seen):
+    match [opt for opt in get_args(t) if opt is not NoneType]:
+        case [opt] if len(get_args(t)) == 2:
+            os = recurse(opt, impl, seen)
+            return None if os is None else os | None
+        case _:
+            return None
+
+
+@ovld
+def struct_spec(t: type[FieldModelizable], impl, seen):
+    if t in seen or not is_dataclass(t) or get_origin(t) is not None:
+        return None
+    m = model(t)
+    if m.constructor is not t or not _standard_loader(impl, t):
+        return None
+    if {f.name for f in m.fields} != {f.name for f in fields(t) if f.init}:
+        return None
+    seen = {*seen, t}
+    struct_fields = []
+    for f in m.fields:
+        if f.metavar or f.serialized_name != f.name:
+            return None
+        if (fs := recurse(f.type, impl, seen)) is None:
+            return None
+        if f.default is not MISSING:
+            struct_fields.append((f.name, fs, f.default))
+        elif f.default_factory is not MISSING:
+            struct_fields.append((f.name, fs, msgspec.field(default_factory=f.default_factory)))
+        else:
+            struct_fields.append((f.name, fs))
+    return msgspec.defstruct(
+        t.__name__,
+        struct_fields,
+        forbid_unknown_fields=not m.allow_extras,
+    )
+
+
+@ovld
+def struct_spec(t: object, impl, seen):
+    # Exact types only: subclasses such as str enums need serieux's own handling
+    return t if t in (str, int, float, bool, NoneType) else None
+
+
+def _standard_loader(impl, t):
+    # Features or user methods that customize how t is loaded replace the ModelLoader
+    fn = impl.deserialize.resolve(type[t], dict, EmptyContext)
+    return isinstance(generated_code(fn), ModelLoader)
+
+
+_decoders = OrderedDict()
+_decoders_size = 256
+_decoders_lock = threading.Lock()
+
+
+def typed_decoder(impl, t):
+    key = (type(impl), t)
+    with _decoders_lock:
+        if key in _decoders:
+            _decoders.move_to_end(key)
+            return _decoders[key]
+        spec = struct_spec(t, impl, frozenset())
+        rval = _decoders[key] = (
+            None if spec is None else TypedDecoder(decoder=msgspec.json.Decoder(type=spec), type=t)
+        )
+        while len(_decoders) > _decoders_size:
+            _decoders.popitem(last=False)
+        return rval
+
+
+##################
+# Implementation #
+##################
+
+
+PRIO = FROMFILE_PRIO.next()
+
+
+class FusedDecoding(Medley):
+    @ovld(priority=PRIO)
+    def deserialize(self, t: Any, obj: FileSource, ctx: EmptyContext):
+        if (
+            type(obj.format) is not JSON
+            or obj.field
+            or not obj.path.exists()
+            or (dec := typed_decoder(self, t)) is None
+        ):
+            return call_next(t, obj, ctx)
+        try:
+            return load_mapped(obj.path, dec.decode)
+        except msgspec.MsgspecError:
+            # Let the generic path produce a proper error, or handle keys such as
+            # $include or $class that the typed decoder does not understand
+            return call_next(t, obj, ctx)
@@ -15,6 +15,7 @@ from ..priority import HI1
 from ..utils import UnionAlias
 from .lazy import LazyProxy
 from .partial import Sources
+from .profile import profiled
 
 
 @ovld
@@ -147,7 +148,8 @@ class Interpolation(Medley):
             case [s]:
                 return call_next(t, s, ctx)
             case ["", expr, ""]:
-                obj = ctx.resolve_variable(t, expr)
+                with profiled(ctx, "Interpolation", expr):
+                    obj = ctx.resolve_variable(t, expr)
                 if isinstance(obj, LazyProxy):
 
                     def interpolate():
@@ -0,0 +1,94 @@
+import base64
+import sys
+from pickle import PickleBuffer
+
+from ovld import Medley, class_check, ovld
+
+from ..ctx import Binary, Context
+from ..exc import ValidationError
+from ..priority import STD
+
+# Objects that can be given to np.frombuffer directly
+buffer_types = (bytes, bytearray, memoryview, PickleBuffer)
+
+
+@class_check
+def NDArray(t):
+    # numpy is only imported by this feature once an array type is seen, and array
+    # types can only exist if numpy was imported already
+    np = sys.modules.get("numpy")
+    return np is not None and isinstance(t, type) and issubclass(t, np.ndarray)
+
+
+def _payload(arr, ctx):
+    import numpy as np
+
+    if arr.dtype.hasobject:
+        raise ValidationError(f"Cannot serialize an array of dtype '{arr.dtype}'", ctx=ctx)
+    # Non-contiguous arrays (e.g. slices) are copied once, here
+    arr = np.ascontiguousarray(arr)
+    return {
+        "dtype": arr.dtype.str,
+        "shape": list(arr.shape),
+        "data": arr,
+    }
+
+
+class NumpyArrays(Medley):
+    @ovld(priority=STD)
+    def serialize(self, t: type[NDArray], obj: object, ctx: Context, /):
+        rval = _payload(obj, ctx)
+        rval["data"] = base64.b64encode(rval["data"]).decode("ascii")
+        return rval
+
+    @ovld(priority=STD)
+    def serialize(self, t: type[NDArray], obj: object, ctx: Binary, /):
+        rval = _payload(obj, ctx)
+        # PickleBuffer exposes the array's memory without copying it, and can be
+        # pickled with protocol 5
+        rval["data"] = PickleBuffer(rval["data"])
+        return rval
+
+    @ovld(priority=STD)
+    def deserialize(self, t: type[NDArray], obj: dict, ctx: Context, /):
+        import numpy as np
+
+        try:
+            dtype = np.dtype(obj["dtype"])
+            shape = tuple(obj["shape"])
+            data = obj["data"]
+        except KeyError as exc:
+            raise ValidationError(f"Missing field {exc} for numpy array", ctx=ctx)
+        except TypeError as exc:
+            raise ValidationError(exc=exc, ctx=ctx)
+        if isinstance(data, str):
+            data = base64.b64decode(data)
+        elif not isinstance(data, buffer_types):
+            raise ValidationError(f"Cannot read array data from '{type(data).__name__}'", ctx=ctx)
+        try:
+            # If data is immutable, so is the array, because they share memory
+            return np.frombuffer(data, dtype=dtype).reshape(shape)
+        except ValueError as exc:
+            raise ValidationError(exc=exc, ctx=ctx)
+
+    @ovld(priority=STD)
+    def deserialize(self, t: type[NDArray], obj: list, ctx: Context, /):
+        import numpy as np
+
+        try:
+            return np.array(obj)
+        except ValueError as exc:  # pragma: no cover
+            raise ValidationError(exc=exc, ctx=ctx)
+
+    @ovld(priority=STD)
+    def schema(self, t: type[NDArray], ctx: Context, /):
+        return {
+            "type": "object",
+            "properties": {
+                "dtype": {"type": "string"},
+                "shape": {"type": "array", "items": {"type": "integer"}},
+                "data": {"type": "string", "contentEncoding": "base64"},
+            },
+            "required": ["dtype", "shape", "data"],
+            "additionalProperties": False,
+        }
@@ -1,9 +1,16 @@
+import textwrap
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field, fields, make_dataclass, replace
 from functools import reduce
+from types import NoneType
 from typing import TYPE_CHECKING, Annotated, Any, TypeAlias
 
-from ovld import Medley, call_next, ovld, recurse
+from ovld import Code, Medley, call_next, ovld, recurse
+from ovld.utils import NameDatabase
 
+from ..codecache import instantiate_code
 from ..ctx import Context
 from ..exc import (
     BaseSerieuxError,
@@ -16,6 +23,7 @@ from ..instructions import Instruction, T, has_instruction, strip
 from ..model import FieldModelizable, ListModelizable, Model, model
 from ..priority import HI4
 from ..proxy import LazyProxy
+from .profile import profiled
 
 #############
 # Constants #
@@ -35,6 +43,9 @@ class NOT_GIVEN_T:
 NOT_GIVEN = NOT_GIVEN_T()
 
 
+_scalars = frozenset({int, float, str, bool, NoneType})
+
+
 class PartialBase:
     pass
 
@@ -43,6 +54,10 @@ class AllTrails(Context):
     pass
 
 
+class ParallelSources(Context):
+    max_workers: int = None
+
+
 @dataclass
 class Override:
     value: object
@@ -82,9 +97,77 @@ def partialize(t: type[FieldModelizable]):
         fields=fields,
         namespace={"_constructor": staticmethod(m.constructor), "_model": m},
     )
+    dc._merge = staticmethod(_generate_merge(dc))
+    dc._instantiate = staticmethod(_generate_instantiate(dc, m))
     return dc
 
 
+def _make_function(name, args, body):
+    ndb = NameDatabase()
+    for arg in args:
+        ndb.register(arg)
+    code = f"def {name}({', '.join(args)}):\n{textwrap.indent(body.fill(ndb), '    ')}"
+    return instantiate_code(name, code, ndb.variables)
+
+
+def _generate_merge(dc):
+    # Fields that are not given in one of the sources do not need to go through merge,
+    # unless the other is a NotGivenError, which NOT_GIVEN takes precedence over
+    part = Code(
+        "b if (a := xd[$name]) is $NOT_GIVEN and not isinstance(b := yd[$name], $NGE)"
+        " else a if (b := yd[$name]) is $NOT_GIVEN and not isinstance(a, $NGE)"
+        " else $merge(a, b)"
+    )
+    body = Code(
+        ["xd = x.__dict__", "yd = y.__dict__", "return $cls($[, ]parts)"],
+        cls=dc,
+        parts=[part.sub(name=f.name) for f in fields(dc)],
+        NOT_GIVEN=NOT_GIVEN,
+        NGE=NotGivenError,
+        merge=merge,
+    )
+    return _make_function("merge_fields", ("x", "y"), body)
+
+
+def _generate_instantiate(dc, m):
+    # Scalars do not need to go through instantiate
+    part = Code(
+        [
+            "if (v := pd[$name]) is not $NOT_GIVEN:",
+            [
+                "if type(v) in $scalars:",
+                ["args[$name] = v"],
+                "elif isinstance(v := $instantiate(v), $BaseSerieuxError):",
+                ["err = $merge_errors(err, v)"],
+                "else:",
+                ["args[$name] = v"],
+            ],
+        ]
+    )
+    body = Code(
+        [
+            "pd = p.__dict__",
+            "args = {}",
+            "err = None",
+            *[part.sub(name=f.name) for f in m.fields],
+            "if err:",
+            ["return err"],
+            "try:",
+            ["return $constructor(**args)"],
+            "except Exception as exc:",
+            ["return $VE(exc=exc, ctx=p._serieux_ctx)"],
+        ],
+        NOT_GIVEN=NOT_GIVEN,
+        scalars=_scalars,
+        instantiate=instantiate,
+        BaseSerieuxError=BaseSerieuxError,
+        merge_errors=merge_errors,
+        constructor=m.constructor,
+        VE=ValidationError,
+    )
+    return _make_function("instantiate_fields", ("p",), body)
+
+
 @dataclass
 class PartialListModelizable:
     elements: list
@@ -119,6 +202,26 @@ def partialize(t: object):
     return Partial[t]
 
 
+# Partial classes are expensive to make, and their identity matters (e.g. for the
+# merge fast path), so the same class is given back for the same type for as long
+# as it stays in the cache
+_partial_cache = OrderedDict()
+_partial_cache_size = 1024
+_partial_lock = threading.Lock()
+
+
+def partial_class(t):
+    """Return partialize(t), reusing the class previously made for t."""
+    with _partial_lock:
+        if (rval := _partial_cache.get(t, None)) is not None:
+            _partial_cache.move_to_end(t)
+            return rval
+        rval = _partial_cache[t] = partialize(t)
+        while len(_partial_cache) > _partial_cache_size:
+            _partial_cache.popitem(last=False)
+        return rval
+
+
 ###################
 # Implementations #
 ###################
@@ -146,16 +249,26 @@ class PartialBuilding(Medley):
     @ovld(priority=HI4.next())
     def deserialize(self, t: Any, obj: Sources, ctx: Context, /):
         is_partial = has_instruction(t, Partial)
-        parts = []
-        for src in obj.sources:
+        pt = t if is_partial else Partial[t]
+
+        def part(src):
             try:
-                parts.append(recurse(t if is_partial else Partial[t], src, ctx))
+                return recurse(pt, src, ctx)
             except BaseSerieuxError as exc:  # pragma: no cover
-                parts.append(exc)
-        merged = reduce(merge, parts)
+                return exc
+
+        if isinstance(ctx, ParallelSources) and len(obj.sources) > 1:
+            with ThreadPoolExecutor(ctx.max_workers) as pool:
+                # map returns the parts in order, so the merge is the same as in sequence
+                parts = list(pool.map(part, obj.sources))
+        else:
+            parts = [part(src) for src in obj.sources]
+        with profiled(ctx, "PartialBuilding", "merge"):
+            merged = reduce(merge, parts)
         if is_partial:
             return merged
-        rval = instantiate(merged)
+        with profiled(ctx, "PartialBuilding", "instantiate"):
+            rval = instantiate(merged)
         if isinstance(rval, BaseSerieuxError):
             raise rval
         return rval
@@ -172,7 +285,7 @@ class PartialBuilding(Medley):
 
 @model.register(priority=2)
 def _(p: type[Any @ Partial]):
-    return call_next(partialize(strip(p, Partial)))
+    return call_next(partial_class(strip(p, Partial)))
 
 
 ######################
@@ -250,6 +363,8 @@ def merge(x: Override, y: Override):
 
 @ovld
 def merge(x: PartialBase, y: PartialBase):
+    if type(x) is type(y):
+        return x._merge(x, y)
     xm = x._model
     ym = y._model
     if xm is ym or xm.is_submodel_of(ym):
@@ -354,14 +469,7 @@ def instantiate(xs: dict):
 
 @ovld
 def instantiate(p: PartialBase):
-    dc = p._constructor
-    args = recurse({f.name: getattr(p, f.name) for f in p._model.fields})
-    if isinstance(args, BaseSerieuxError):
-        return args
-    try:
-        return dc(**args)
-    except Exception as exc:
-        return ValidationError(exc=exc, ctx=p._serieux_ctx)
+    return p._instantiate(p)
 
 
 @ovld
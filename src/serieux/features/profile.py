@@ -0,0 +1,82 @@
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import field
+from pathlib import Path
+from typing import Any
+
+from ovld import Medley, call_next, ovld
+
+from ..ctx import Context
+from ..priority import MAX
+from ..utils import clsstring
+
+_no_profile = nullcontext()
+
+
+class Profile(Context):
+    # (method, type) -> [number of calls, cumulative time]
+    timings: dict = field(default_factory=dict, repr=False)
+    # stack of labels -> time spent in the last frame, excluding its children
+    stacks: dict = field(default_factory=dict, repr=False)
+    local: threading.local = field(default_factory=threading.local, repr=False)
+    # Sources may be loaded from several threads, e.g. with ParallelSources
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @contextmanager
+    def measure(self, method: str, what: object):
+        """Measure the enclosed code as a call of method (or feature) on what."""
+        key = (method, what)
+        label = f"{method}:{what if isinstance(what, str | Path) else clsstring(what)}"
+        stack = getattr(self.local, "stack", None)
+        if stack is None:
+            stack = self.local.stack = []
+        # Each frame is [label, time spent in children]
+        frame = [label, 0.0]
+        stack.append(frame)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            labels = tuple(lbl for lbl, _ in stack)
+            stack.pop()
+            if stack:
+                stack[-1][1] += elapsed
+            with self.lock:
+                entry = self.timings.setdefault(key, [0, 0.0])
+                entry[0] += 1
+                entry[1] += elapsed
+                self.stacks[labels] = self.stacks.get(labels, 0.0) + elapsed - frame[1]
+
+    def report(self, unit: float = 1e-6):
+        """Return the profile in the collapsed stack format used by flamegraph tools.
+
+        Each line is the semicolon-separated stack followed by the time spent in the
+        last frame, as an integer number of units (microseconds by default).
+        """
+        return "".join(
+            f"{';'.join(labels)} {round(t / unit)}\n" for labels, t in self.stacks.items()
+        )
+
+    def dump_report(self, dest: Path, unit: float = 1e-6):
+        Path(dest).write_text(self.report(unit))
+
+
+def profiled(ctx: Context, method: str, what: object):
+    """Measure a section if ctx is a Profile, otherwise do nothing."""
+    if isinstance(ctx, Profile):
+        return ctx.measure(method, what)
+    return _no_profile
+
+
+class Profiling(Medley):
+    @ovld(priority=MAX)
+    def serialize(self, t: Any, obj: Any, ctx: Profile, /):
+        with ctx.measure("serialize", t):
+            return call_next(t, obj, ctx)
+
+    @ovld(priority=MAX)
+    def deserialize(self, t: Any, obj: Any, ctx: Profile, /):
+        with ctx.measure("deserialize", t):
+            return call_next(t, obj, ctx)
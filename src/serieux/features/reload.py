@@ -0,0 +1,180 @@
+from dataclasses import dataclass, replace
+from functools import reduce
+from pathlib import Path
+from typing import Generic, TypeVar
+
+from ..ctx import Context, empty
+from ..exc import BaseSerieuxError
+from ..formats import FileSource
+from ..instructions import has_instruction
+from ..proxy import LazyProxy
+from .partial import (
+    NOT_GIVEN,
+    Override,
+    Partial,
+    PartialBase,
+    PartialListModelizable,
+    instantiate,
+    merge,
+)
+
+T = TypeVar("T")
+
+
+@dataclass
+class _Node:
+    # Instantiated value of a part of the merged data, with the nodes of its fields
+    value: object
+    children: dict = None
+
+
+def _stamp(src):
+    match src:
+        case FileSource():
+            path = src.path
+        case Path():
+            path = src
+        case _:
+            # Other sources cannot change
+            return ()
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _entries(p):
+    if isinstance(p, PartialBase):
+        return {f.name: getattr(p, f.name) for f in p._model.fields}
+    return p
+
+
+def _same(x, y):
+    """Check whether two pieces of partial data would instantiate to the same value."""
+    if x is y:
+        return True
+    if type(x) is not type(y):
+        return False
+    if isinstance(x, PartialBase):
+        # The contexts are not compared, they contain the surrounding data
+        return _same(_entries(x), _entries(y))
+    if isinstance(x, PartialListModelizable):
+        return _same(x.elements, y.elements)
+    if isinstance(x, Override):
+        return _same(x.value, y.value)
+    if isinstance(x, dict):
+        return x.keys() == y.keys() and all(_same(v, y[k]) for k, v in x.items())
+    if isinstance(x, list):
+        return len(x) == len(y) and all(map(_same, x, y))
+    if isinstance(x, (BaseSerieuxError, LazyProxy)):
+        return False
+    try:
+        return bool(x == y)
+    except Exception:  # pragma: no cover
+        return False
+
+
+def _rebuild(old, new, node, trail, changed):
+    """Instantiate new, reusing the nodes built from old where the data is the same.
+
+    The trails of the parts that are instantiated anew are appended to changed.
+    """
+    if node is not None and type(old) is not type(new):
+        node = None
+    if node is None and changed is not None:
+        changed.append(trail)
+        # Everything below this point is new, so it does not need to be reported
+        changed = None
+
+    if not isinstance(new, (PartialBase, dict)):
+        if node is not None and _same(old, new):
+            return node
+        if changed is not None:
+            changed.append(trail)
+        return _Node(instantiate(new))
+
+    olds = _entries(old) if node is not None else {}
+    reused = node is not None
+    children = {}
+    for k, n in _entries(new).items():
+        o = olds.get(k, NOT_GIVEN)
+        if n is NOT_GIVEN:
+            if o is not NOT_GIVEN:
+                reused = False
+                changed.append((*trail, k))
+            continue
+        child = node.children.get(k) if node is not None else None
+        sub = children[k] = _rebuild(o, n, child, (*trail, k), changed)
+        reused = reused and sub is child
+    if node is not None and isinstance(new, dict):
+        for k in olds.keys() - new.keys():
+            if olds[k] is not NOT_GIVEN:
+                reused = False
+                changed.append((*trail, k))
+
+    if reused:
+        return node
+    # The values of the children are already built, so they are passed through as is
+    built = {k: Override(sub.value) for k, sub in children.items()}
+    if isinstance(new, dict):
+        value = instantiate(type(new)(built))
+    else:
+        value = instantiate(replace(new, **built))
+    return _Node(value, children)
+
+
+class Reloader(Generic[T]):
+    """Value deserialized from several sources, which can be reloaded incrementally.
+
+    Each source is deserialized on its own as a Partial. When reload() is called,
+    only the files that were modified are read again, and after merging, only the
+    parts of the value that differ from the previous merge are instantiated again.
+    The other parts are the same objects as in the previous value.
+
+    Files that are pulled in by a source, e.g. with $include, are not watched.
+    """
+
+    def __init__(self, value_type: type, sources: list, serieux=None, context: Context = empty):
+        if serieux is None:
+            from .. import serieux
+        self.value_type = value_type
+        self.partial_type = (
+            value_type if has_instruction(value_type, Partial) else Partial[value_type]
+        )
+        self.sources = list(sources)
+        self.serieux = serieux
+        self.context = context
+        self.value = None
+        self._stamps = [None] * len(self.sources)
+        self._parts = [NOT_GIVEN] * len(self.sources)
+        self._merged = NOT_GIVEN
+        self._root = None
+        self.reload()
+
+    def reload(self):
+        """Update the value from the sources that changed.
+
+        Returns the trails of the parts of the value that were instantiated again,
+        which is [()] on the first load and [] if nothing changed. If the new data
+        is invalid, the error is raised and the previous value is kept.
+        """
+        stamps = [_stamp(src) for src in self.sources]
+        parts = list(self._parts)
+        for i, src in enumerate(self.sources):
+            if self._root is None or stamps[i] is None or stamps[i] != self._stamps[i]:
+                parts[i] = self.serieux.deserialize(self.partial_type, src, self.context)
+        if self._root is not None and all(map(_same, parts, self._parts)):
+            self._stamps = stamps
+            return []
+        merged = reduce(merge, parts)
+        changed = []
+        root = _rebuild(self._merged, merged, self._root, (), changed)
+        if isinstance(root.value, BaseSerieuxError):
+            raise root.value
+        self._stamps = stamps
+        self._parts = parts
+        self._merged = merged
+        self._root = root
+        self.value = root.value
+        return changed
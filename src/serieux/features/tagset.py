@@ -3,15 +3,26 @@ import importlib.metadata
 from collections import deque
 from dataclasses import dataclass, field
 from functools import cached_property
-from typing import TYPE_CHECKING, Annotated, Any, Callable, Iterable, TypeAlias, Union
-
-from ovld import Medley, call_next, ovld, recurse
-
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+    Any,
+    Callable,
+    Iterable,
+    TypeAlias,
+    Union,
+    get_args,
+)
+
+from ovld import Medley, call_next, code_generator, ovld, recurse
+
+from ..codecache import generated_code
 from ..ctx import Context
 from ..exc import ValidationError
+from ..impl import ModelLoader, _noop
 from ..instructions import BaseInstruction, Instruction, T, annotate, pushdown, strip
-from ..model import constructed_type
-from ..priority import HI2
+from ..model import FieldModelizable, constructed_type, model, subtypes
+from ..priority import HI2, STD
 from ..schema import AnnotatedSchema
 from ..tell import KeyValueTell, tells
 
@@ -20,6 +31,11 @@ value_field = "$value"
 
 
 class TagSet(BaseInstruction):  # pragma: no cover
+    # Whether get_type always returns the same type for a given tag, so that it can be
+    # cached. Only set it if that holds regardless of the context and for the lifetime
+    # of the TagSet.
+    cacheable = False
+
     def get_type(self, tag: str | None, ctx: Context = None) -> type:
         raise NotImplementedError()
 
@@ -77,6 +93,8 @@ class Tag(TagSet):
     tag: str
     cls: type
 
+    cacheable = True
+
     def get_type(self, tag: str | None, ctx: Context = None) -> type:
         if tag is None:
             raise ValidationError(f"Tag '{self.tag}' is required", ctx=ctx)
@@ -101,6 +119,8 @@ class FromEntryPoint(TagSet):
     default: type = None
     wrap: Callable = None
 
+    cacheable = True
+
     @cached_property
     def elements(self):
         def _wrap(t):
@@ -152,6 +172,8 @@ class _ReferencedClass(TagSet):
     default: type = None
     default_module: str = None
 
+    cacheable = True
+
     def get_type(self, tag: str | None, ctx: Context) -> type:
         if tag is None:
             if self.default is not None:
@@ -243,6 +265,10 @@ class MultiTagSet(TagSet):
     def closed(self, base):
         return all(ts.closed(base) for ts in self.tagsets)
 
+    @property
+    def cacheable(self):
+        return all(ts.cacheable for ts in self.tagsets)
+
 
 def decompose(annt):
     base = pushdown(annt)
@@ -254,6 +280,40 @@ def decompose(annt):
     return base, ts
 
 
+if TYPE_CHECKING:
+    TagField: TypeAlias = Annotated[T, None]
+else:
+    # The input of the annotated type still holds the tag field, which is not an extra field
+    TagField = Instruction("TagField", inherit=False)
+
+
+def _resolve_tag(impl, t, tag, ctx):
+    base, ts = decompose(t)
+    declared = ts.get_type(tag, ctx)
+    if base is not Any and base is not object and isinstance(base, type):
+        actual_class = constructed_type(declared)
+        if not issubclass(actual_class, base):
+            raise ValidationError(f"'{actual_class}' is not a subclass of '{base}'", ctx=ctx)
+    target = strip(annotate(declared, t), TagSet)
+    # The standard loader of types with fields can skip the tag, so the input does not have
+    # to be copied. Other loaders, e.g. serieux_deserialize, get the input without the tag.
+    tagged_target = None
+    if issubclass(target, FieldModelizable):
+        loader = impl.deserialize.resolve(type[TagField[target]], dict, type(ctx))
+        if isinstance(generated_code(loader), ModelLoader):
+            tagged_target = TagField[target]
+    entry = (target, tagged_target)
+    if ts.cacheable:
+        try:
+            # (TagSet type, context type) -> tag -> (type to deserialize into, same for
+            # a dict that holds the tag), kept on the instance since loaders depend on it
+            targets = impl.__dict__.setdefault("_tag_targets", {})
+            targets.setdefault((t, type(ctx)), {})[tag] = entry
+        except TypeError:  # pragma: no cover
+            pass
+    return entry
+
+
 class TagSetFeature(Medley):
     @ovld(priority=HI2.next())
     def serialize(self, t: type[Any @ TagSet], obj: object, ctx: Context, /):
@@ -270,18 +330,36 @@ class TagSetFeature(Medley):
         return rval
 
     def deserialize(self, t: type[Any @ TagSet], obj: dict, ctx: Context, /):
-        base, ts = decompose(t)
-        data = dict(obj)
-        tag = data.pop(tag_field, None)
-        data = data.pop(value_field, data)
+        tag = obj.get(tag_field, None)
         if tag is not None:
             tag = recurse(str, tag, ctx)
-        declared = ts.get_type(tag, ctx)
-        if base is not Any and base is not object and isinstance(base, type):
-            actual_class = constructed_type(declared)
-            if not issubclass(actual_class, base):
-                raise ValidationError(f"'{actual_class}' is not a subclass of '{base}'", ctx=ctx)
-        return recurse(strip(annotate(declared, t), TagSet), data, ctx)
+        try:
+            target, tagged_target = self._tag_targets[t, type(ctx)][tag]
+        except (AttributeError, KeyError, TypeError):
+            target, tagged_target = _resolve_tag(self, t, tag, ctx)
+        if value_field in obj:
+            return recurse(target, obj[value_field], ctx)
+        elif tag is None:
+            return recurse(target, obj, ctx)
+        elif tagged_target is not None:
+            return recurse(tagged_target, obj, ctx)
+        else:
+            return recurse(target, {k: v for k, v in obj.items() if k != tag_field}, ctx)
+
+    @code_generator(priority=STD)
+    def process_extra_fields(cls, t: type[Any @ TagField], obj: dict, ctx: Context, /):
+        (t,) = get_args(t)
+        base = strip(t, TagField)
+        process = cls.process_extra_fields.__ovld__.resolve(type[base], dict, ctx)
+        if process is _noop:
+            return _noop
+        expected = {f.serialized_name for f in model(base).fields}
+
+        def process_tagged_extra_fields(self, t, obj, ctx):
+            if obj.keys() - expected != {tag_field}:
+                process(self, base, {k: v for k, v in obj.items() if k != tag_field}, ctx)
+
+        return process_tagged_extra_fields
 
     def schema(self, t: type[Any @ TagSet], ctx: Context):
         base, ts = decompose(t)
@@ -316,6 +394,12 @@ def tells(expected: type[Any @ TagSet], given: type[dict]):
     return {KeyValueTell(tag_field, tag) for tag, _ in ts.iterate(base)}
 
 
+@subtypes.register(priority=HI2.next())
+def subtypes(t: type[Any @ TagSet]):
+    base, ts = decompose(t)
+    return [strip(annotate(sc, t), TagSet) for _, sc in ts.iterate(base)]
+
+
 if TYPE_CHECKING:
     TaggedSubclass: TypeAlias = Annotated[T, None]
     Tagged: TypeAlias = Annotated
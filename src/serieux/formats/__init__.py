@@ -1,10 +1,128 @@
-import importlib.metadata
+import mmap
+import threading
+from collections import OrderedDict
+from copy import deepcopy
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 
 from .abc import FileFormat
 
 
+def copy_parsed(data):
+    """Copy parsed data, down to its buffers, so that loads do not share mutable state."""
+    t = type(data)
+    if t is dict:
+        return {k: copy_parsed(v) for k, v in data.items()}
+    elif t is list:
+        return [copy_parsed(x) for x in data]
+    elif t in (str, int, float, bool) or data is None:
+        return data
+    elif t in (bytes, bytearray):
+        # Arrays are deserialized without copying their buffer, so even immutable
+        # buffers are copied
+        return t(bytearray(data))
+    else:
+        return deepcopy(data)
+
+
+class ParseCache:
+    """LRU cache of parsed files, keyed on (path, mtime, size, kind).
+
+    A file is only kept once it has been parsed twice, so a file that is loaded once
+    is returned as parsed, without being copied or kept around. The data that is kept
+    is for the cache's own use: later loads return a copy of it, so that modifying the
+    result of a load does not affect the next ones.
+
+    The cache is bounded by the total size of the files it keeps, and files larger
+    than max_file_size are not kept at all.
+    """
+
+    def __init__(self, maxbytes: int = 16 * 2**20, max_file_size: int = 2**20):
+        self.maxbytes = maxbytes
+        self.max_file_size = max_file_size
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._seen = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path: Path, kind: object, parse, copy: bool = True):
+        """Return parse(path), reusing the previous result if the file did not change.
+
+        With copy=False, the result is kept the first time it is parsed, and the kept
+        object itself is returned, so it must not be modified.
+        """
+        if not self.maxbytes:
+            return parse(path)
+        st = path.stat()
+        if st.st_size > self.max_file_size:
+            return parse(path)
+        key = (str(path.absolute()), st.st_mtime_ns, st.st_size, kind)
+        with self._lock:
+            if (entry := self._entries.get(key, None)) is not None:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            else:
+                self.misses += 1
+                keep = not copy or key in self._seen
+                if not keep:
+                    self._seen[key] = True
+                    while len(self._seen) > _seen_size:
+                        self._seen.popitem(last=False)
+        if entry is not None:
+            data = entry[0]
+            return copy_parsed(data) if copy else data
+        data = parse(path)
+        if not keep:
+            return data
+        with self._lock:
+            if key not in self._entries:
+                self._seen.pop(key, None)
+                self._entries[key] = (data, st.st_size)
+                self.nbytes += st.st_size
+                while self.nbytes > self.maxbytes:
+                    _, (_, size) = self._entries.popitem(last=False)
+                    self.nbytes -= size
+        return copy_parsed(data) if copy else data
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._seen.clear()
+            self.nbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+
+# Number of files parsed once that the cache remembers, to keep them if they are loaded again
+_seen_size = 1024
+
+parse_cache = ParseCache()
+
+
+def load_mapped(p: Path, parse):
+    """Return parse(buffer) on a read-only memory map of the file at p.
+
+    The buffer is released afterwards, so the result must not refer to it.
+    """
+    with open(p, "rb") as fh:
+        try:
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty files and special files cannot be mapped
+            return parse(fh.read())
+        with mm, memoryview(mm) as buf:
+            return parse(buf)
+
+
+def load_file(fmt: FileFormat, p: Path):
+    if fmt.load_buffer is not None:
+        return load_mapped(p, fmt.load_buffer)
+    return fmt.load(p)
+
+
 @dataclass
 class FileSource:
     path: Path
@@ -20,7 +138,7 @@ class FileSource:
             from ..exc import ValidationError
 
             raise ValidationError(f"File '{self.path.absolute()}' does not exist")
-        data = self.format.load(self.path)
+        data = parse_cache.get(self.path, self.format, partial(load_file, self.format))
         if self.field:
             for f in self.field.split("."):
                 data = data[f]
@@ -34,6 +152,8 @@ class FileSource:
 
 class FormatRegistry(dict):
     def __missing__(self, item):
+        import importlib.metadata
+
         match importlib.metadata.entry_points(group="serieux.formats", name=item):
             case [ep, *__]:
                 ff_cls = ep.load()
@@ -55,13 +175,21 @@ def find(p: Path, suffix: str | None = None):
 
 
 def load(p: Path, suffix: str | None = None):
-    return find(p, suffix).load(p)
+    return load_file(find(p, suffix), p)
 
 
 def dump(p: Path, data: object, suffix: str | None = None):
     return find(p, suffix).dump(p, data)
 
 
+def load_iter(p: Path, suffix: str | None = None):
+    return find(p, suffix).load_iter(p)
+
+
+def dump_iter(p: Path, data: object, suffix: str | None = None):
+    return find(p, suffix).dump_iter(p, data)
+
+
 def loads(s: str, suffix: str | None = None):
     return find(None, suffix).loads(s)
 
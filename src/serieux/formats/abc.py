@@ -2,6 +2,13 @@ from pathlib import Path
 
 
 class FileFormat:  # pragma: no cover
+    # Whether the format can store bytes and other buffers directly
+    binary = False
+
+    # Formats that can parse a read-only buffer (e.g. a memory-mapped file) without
+    # copying it into a str or bytes set this to a function of (self, buffer)
+    load_buffer = None
+
     def locate(self, f: Path, trail: tuple[str]):
         return None
 
@@ -20,6 +27,12 @@ class FileFormat:  # pragma: no cover
     def dump(self, f: Path, data):
         f.write_text(self.dumps(data))
 
+    def load_iter(self, f: Path):
+        yield from self.load(f)
+
+    def dump_iter(self, f: Path, data):
+        self.dump(f, list(data))
+
     @classmethod
     def serieux_from_string(cls, suffix):
         from . import registry
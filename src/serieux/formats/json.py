@@ -3,18 +3,24 @@ from functools import partial
 from ..utils import import_any
 from .abc import FileFormat
 
-loads, dumps = import_any(
+loads, dumps, accepts_buffers = import_any(
     feature="JSON loading and dumping",
     candidates={
-        "msgspec.json": lambda m: (m.decode, m.encode),
-        "orjson": lambda m: (m.loads, m.dumps),
-        "ujson": lambda m: (m.loads, partial(m.dumps, ensure_ascii=False)),
-        "json": lambda m: (m.loads, partial(m.dumps, ensure_ascii=False)),
+        "msgspec.json": lambda m: (m.decode, m.encode, True),
+        "orjson": lambda m: (m.loads, m.dumps, True),
+        "ujson": lambda m: (m.loads, partial(m.dumps, ensure_ascii=False), False),
+        "json": lambda m: (m.loads, partial(m.dumps, ensure_ascii=False), False),
     },
 )
 
 
+def _load_buffer(self, buf):
+    return loads(buf)
+
+
 class JSON(FileFormat):
+    load_buffer = _load_buffer if accepts_buffers else None
+
     def loads(self, s: str):
         return loads(s)
 
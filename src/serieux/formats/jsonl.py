@@ -0,0 +1,24 @@
+from pathlib import Path
+
+from .json import JSON
+
+
+class JSONL(JSON):
+    load_buffer = None
+
+    def loads(self, s: str):
+        return [JSON.loads(self, line) for line in s.splitlines() if line.strip()]
+
+    def dumps(self, data):
+        return "".join(f"{JSON.dumps(self, x)}\n" for x in data)
+
+    def load_iter(self, f: Path):
+        with open(f, encoding="utf-8") as fh:
+            for line in fh:
+                if line.strip():
+                    yield JSON.loads(self, line)
+
+    def dump_iter(self, f: Path, data):
+        with open(f, "w", encoding="utf-8") as fh:
+            for x in data:
+                fh.write(f"{JSON.dumps(self, x)}\n")
@@ -0,0 +1,99 @@
+import threading
+from pathlib import Path
+
+from ..exc import ValidationError
+from ..utils import import_any
+from .abc import FileFormat
+
+msgpack = import_any(
+    feature="MessagePack loading and dumping",
+    candidates={"msgpack": lambda m: m},
+)
+
+
+def _default(obj):
+    # Other objects that support the buffer protocol, e.g. PickleBuffer, are packed as bin
+    try:
+        return memoryview(obj)
+    except TypeError:
+        raise TypeError(f"Cannot serialize object of type {type(obj).__name__} to MessagePack")
+
+
+def _unpackb(buf):
+    try:
+        return msgpack.unpackb(buf, strict_map_key=False)
+    except msgpack.ExtraData:
+        raise ValidationError("MessagePack data contains more than one object")
+
+
+class MsgPack(FileFormat):
+    binary = True
+
+    def __init__(self):
+        self._local = threading.local()
+
+    @property
+    def packer(self):
+        # Each thread reuses the same packer, and therefore the same buffer
+        try:
+            return self._local.packer
+        except AttributeError:
+            packer = self._local.packer = msgpack.Packer(default=_default, autoreset=False)
+            return packer
+
+    def load_buffer(self, buf):
+        return _unpackb(buf)
+
+    def loads(self, s: bytes):
+        return _unpackb(s)
+
+    def dumps(self, data):
+        packer = self.packer
+        try:
+            packer.pack(data)
+            return packer.bytes()
+        finally:
+            packer.reset()
+
+    def load(self, f: Path):
+        return self.loads(f.read_bytes())
+
+    def dump(self, f: Path, data):
+        f.write_bytes(self.dumps(data))
+
+    # A stream is written and read as a single top-level array, like dump and load do
+    # with a list, so that both ways of writing a file can be read back either way
+
+    def load_iter(self, f: Path):
+        with open(f, "rb") as fh:
+            unpacker = msgpack.Unpacker(fh, strict_map_key=False)
+            try:
+                n = unpacker.read_array_header()
+            except msgpack.OutOfData:
+                return
+            except ValueError:
+                raise ValidationError(f"File '{f}' does not contain a MessagePack array")
+            for _ in range(n):
+                yield unpacker.unpack()
+            try:
+                unpacker.skip()
+            except msgpack.OutOfData:
+                return
+            raise ValidationError(f"File '{f}' contains more than one MessagePack object")
+
+    def dump_iter(self, f: Path, data):
+        packer = self.packer
+        with open(f, "wb") as fh:
+            # The length is not known in advance, so the array32 header is filled in at the end
+            fh.write(b"\xdd\x00\x00\x00\x00")
+            n = 0
+            for x in data:
+                try:
+                    packer.pack(x)
+                    with packer.getbuffer() as buf:
+                        fh.write(buf)
+                finally:
+                    packer.reset()
+                n += 1
+            fh.seek(1)
+            fh.write(n.to_bytes(4, "big"))
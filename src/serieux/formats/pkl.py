@@ -5,8 +5,14 @@ from .abc import FileFormat
 
 
 class PKL(FileFormat):
+    binary = True
+
+    def load_buffer(self, buf):
+        return pickle.loads(buf)
+
     def load(self, f: Path):
         return pickle.loads(f.read_bytes())
 
     def dump(self, f: Path, data):
-        f.write_bytes(pickle.dumps(data))
+        # Protocol 5 is needed to write PickleBuffer objects
+        f.write_bytes(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
@@ -1,10 +1,9 @@
 import json
 from pathlib import Path
 
-from ovld import ovld, recurse
-
 from ..ctx import Location
 from ..utils import import_any
+from . import parse_cache
 from .abc import FileFormat
 
 yaml = import_any(
@@ -30,34 +29,48 @@ def yaml_source_extract(node, origin):
     )
 
 
-@ovld
-def locate(obj: yaml.MappingNode, origin: Path, trail: tuple | list):
-    if trail:
-        nxt, *rest = trail
-        for k, v in obj.value:
-            if k.value == nxt:
-                return recurse(v, origin, rest)
-    return yaml_source_extract(obj, origin)
-
-
-@ovld
-def locate(obj: yaml.SequenceNode, origin: Path, trail: tuple | list):
-    if trail:
-        nxt, *rest = trail
-        for i, v in enumerate(obj.value):
-            if i == nxt:
-                return recurse(v, origin, rest)
-    return yaml_source_extract(obj, origin)  # pragma: no cover
-
-
-@ovld
-def locate(obj: yaml.ScalarNode, origin: Path, trail: tuple | list):
-    return yaml_source_extract(obj, origin)
+def compose(f: Path):
+    return yaml.compose(f.read_text(), Loader)
+
+
+def location_index(f: Path):
+    """Map the trail of every node in the YAML file to its Location."""
+    index = {}
+    root = compose(f)
+    if root is None:
+        return index
+    expanded = set()
+    stack = [((), root)]
+    while stack:
+        trail, node = stack.pop()
+        # If a key is repeated, the first occurrence wins
+        index.setdefault(trail, yaml_source_extract(node, f))
+        # Aliased nodes are only expanded once, which also protects against cycles
+        if id(node) in expanded:
+            continue
+        expanded.add(id(node))
+        if isinstance(node, yaml.MappingNode):
+            stack.extend(
+                ((*trail, k.value), v)
+                for k, v in reversed(node.value)
+                if isinstance(k, yaml.ScalarNode)
+            )
+        elif isinstance(node, yaml.SequenceNode):
+            stack.extend(((*trail, i), v) for i, v in reversed(list(enumerate(node.value))))
+    return index
+
+
+def locate(index: dict, trail: tuple | list):
+    # Missing entries are located at their closest ancestor
+    trail = tuple(trail)
+    while trail and trail not in index:
+        trail = trail[:-1]
+    return index.get(trail, None)
 
 
 class YAML(FileFormat):
     def locate(self, f: Path, trail: tuple[str]):
-        return locate(yaml.compose(f.read_text(), Loader), f, trail)
+        return locate(parse_cache.get(f, "yaml:index", location_index, copy=False), trail)
 
     def patch(self, source, patches):
         for start, end, content in sorted(patches, reverse=True):
@@ -1,11 +1,15 @@
 import math
+import threading
+import time
+from collections import deque
 from dataclasses import MISSING, is_dataclass
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from enum import Enum
 from itertools import pairwise
 from pathlib import Path
 from types import NoneType, UnionType, WrapperDescriptorType
-from typing import Annotated, Any, get_args, get_origin
+from typing import Annotated, Any, Literal, Union, get_args, get_origin
+from zoneinfo import ZoneInfo
 
 from ovld import (
     Code,
@@ -27,13 +31,36 @@ from ovld.utils import subtler_type
 
 from . import formats
 from .auto import Auto
-from .ctx import Context, ModifyContext, OmitDefaults, Sourced, WorkingDirectory, empty
+from .codecache import (
+    dispatch_map,
+    generated_code,
+    inline_expression,
+    locked_ovld,
+)
+from .ctx import (
+    Binary,
+    Context,
+    EmptyContext,
+    ModifyContext,
+    OmitDefaults,
+    Sourced,
+    Trusted,
+    WorkingDirectory,
+    empty,
+)
 from .exc import MissingFieldError, SchemaError, UnrecognizedFieldError, ValidationError
-from .instructions import pushdown
-from .model import FieldModelizable, ListModelizable, Modelizable, StringModelizable, model
+from .instructions import pushdown, strip
+from .model import (
+    FieldModelizable,
+    ListModelizable,
+    Modelizable,
+    StringModelizable,
+    model,
+    subtypes,
+)
 from .priority import HI2, LO4, LO5, LOW, MAX, MIN, STD, STD2, STD3
 from .schema import AnnotatedSchema, Schema
-from .tell import tells as get_tells
+from .tell import KeyTell, KeyValueTell, tells as get_tells
 from .utils import (
     JSON,
     Indirect,
@@ -44,17 +71,99 @@ from .utils import (
     clsstring,
 )
 
+# Types represented by strings, whose serialization code is inlined in enclosing code,
+# except for paths relative to a WorkingDirectory
+_string_types = (date, datetime, timedelta, ZoneInfo, Path)
+_ConcretePath = type(Path())
+
 
 def _noop(*args, **kwargs):  # pragma: no cover
     return None
 
 
+def _deserialize_input_type(t):
+    if issubclass(t, FieldModelizable):
+        return dict
+    elif issubclass(t, ListModelizable):
+        return list
+    elif issubclass(t, StringModelizable):
+        return str
+    else:
+        return None
+
+
+def _precompile_input_types(t, direction):
+    if direction == "deserialize" and (it := _deserialize_input_type(t)) is not None:
+        return {it}
+    bt = basic_type(t)
+    if bt is Union or bt is UnionType:
+        return {it for opt in get_args(strip(t)) for it in _precompile_input_types(opt, direction)}
+    return {bt} if isinstance(bt, type) else set()
+
+
+class ModelLoader(Def):
+    """Code generated by the standard deserializer of FieldModelizable types."""
+
+
+class Guarded(Lambda):
+    """Code for `value if guard else fail`, where guard and value cannot fail.
+
+    Enclosing code inlines the guard and the value, and calls the method when the guard
+    does not hold, so that the failure is raised from the method's own frame and its
+    location in the data can be found.
+    """
+
+    def __init__(self, guard, value, fail, **subs):
+        args = ("self", "t", "obj", "ctx")
+        self.guard = Lambda(args, guard, **subs)
+        self.value = Lambda(args, value, **subs)
+        super().__init__(
+            Code(
+                "$value if $guard else $fail",
+                value=Code(value, subs),
+                guard=Code(guard, subs),
+                fail=Code(fail, subs),
+            )
+        )
+
+
+def _default_context(ctx_t):
+    if ctx_t is EmptyContext:
+        return empty
+    try:
+        return ctx_t()
+    except Exception:
+        # Contexts with required fields, e.g. Sourced, which needs an origin
+        return None
+
+
+def _format_error(fmt, exc, ctx):
+    # Formats raise TypeError on values they cannot hold, e.g. buffers in text formats
+    return ValidationError(
+        f"Cannot write the serialized data as {type(fmt).__name__}: {exc}", exc=exc, ctx=ctx
+    )
+
+
 class BaseImplementation(Medley):
     validate_serialize: CodegenParameter[bool] = True
     validate_deserialize: CodegenParameter[bool] = True
 
+    # Types are resolved and code is generated under a lock for each tuple of types
+    get_serializer = locked_ovld("get_serializer")
+    get_deserializer = locked_ovld("get_deserializer")
+    get_batch_serializer = locked_ovld("get_batch_serializer")
+    get_batch_deserializer = locked_ovld("get_batch_deserializer")
+    serialize = locked_ovld("serialize")
+    deserialize = locked_ovld("deserialize")
+    schema = locked_ovld("schema")
+    serialize_batch = locked_ovld("serialize_batch")
+    deserialize_batch = locked_ovld("deserialize_batch")
+    process_extra_fields = locked_ovld("process_extra_fields")
+
     def __post_init__(self):
         self._schema_cache = {}
+        self._schema_pending = {}
+        self._schema_lock = threading.RLock()
 
     #######################
     # User-facing methods #
@@ -69,29 +178,107 @@ class BaseImplementation(Medley):
         if dest:
             dest = Path(dest)
             ctx = ctx + Sourced(origin=dest)
+        fmt = formats.find(dest, suffix=format) if dest or format else None
+        if fmt is not None and fmt.binary:
+            ctx = ctx + Binary()
         serialized = self.serialize(t, obj, ctx)
-        if dest:
-            formats.dump(p=dest, data=serialized, suffix=format)
-        elif format:
-            return formats.dumps(data=serialized, suffix=format)
-        else:
+        if not dest and not format:
             return serialized
+        try:
+            if dest:
+                fmt.dump(dest, serialized)
+            else:
+                return fmt.dumps(serialized)
+        except TypeError as exc:
+            raise _format_error(fmt, exc, ctx)
+
+    @use_combiner(KeepLast)
+    def iter_load(self, t, obj, ctx=empty, *, format=None):
+        obj = Path(obj)
+        fmt = formats.find(obj, suffix=format)
+        ctx = ctx + Sourced(origin=obj, directory=obj.parent.absolute(), format=fmt)
+        func = self.get_deserializer(t, ctx)
+        for record in fmt.load_iter(obj):
+            yield func(record)
+
+    @use_combiner(KeepLast)
+    def dump_stream(self, t, objs, dest, ctx=empty, *, format=None):
+        dest = Path(dest)
+        fmt = formats.find(dest, suffix=format)
+        ctx = ctx + Sourced(origin=dest)
+        if fmt.binary:
+            ctx = ctx + Binary()
+        func = self.get_serializer(t, ctx)
+        try:
+            fmt.dump_iter(dest, (func(obj) for obj in objs))
+        except TypeError as exc:
+            raise _format_error(fmt, exc, ctx)
 
     def get_serializer(self, t, ctx=empty):
         func = self.serialize.resolve(type[t], get_origin(t) or t, type(ctx))
         return lambda obj: func(self, t, obj, ctx)
 
     def get_deserializer(self, t, ctx=empty):
-        if issubclass(t, FieldModelizable):
-            func = self.deserialize.resolve(type[t], dict, type(ctx))
-        elif issubclass(t, ListModelizable):
-            func = self.deserialize.resolve(type[t], list, type(ctx))
-        elif issubclass(t, StringModelizable):
-            func = self.deserialize.resolve(type[t], str, type(ctx))
+        if (it := _deserialize_input_type(t)) is not None:
+            func = self.deserialize.resolve(type[t], it, type(ctx))
         else:
             func = type(self).deserialize
         return lambda obj: func(self, t, obj, ctx)
 
+    def get_batch_serializer(self, t, ctx=empty):
+        func = self.serialize_batch.resolve(type[t], object, type(ctx))
+        return lambda objs: func(self, t, objs, ctx)
+
+    def get_batch_deserializer(self, t, ctx=empty):
+        func = self.deserialize_batch.resolve(type[t], object, type(ctx))
+        return lambda objs: func(self, t, objs, ctx)
+
+    @use_combiner(KeepLast)
+    def precompile(
+        self,
+        *types,
+        ctx_types=(EmptyContext,),
+        directions=("serialize", "deserialize", "schema"),
+    ):
+        """Build the models, generated code and schemas for types ahead of time.
+
+        The type graph is walked from the given types through fields, elements, union
+        members and tagset options. Returns a dict that maps each type visited to the
+        time spent on each of the directions, in seconds.
+
+        ctx_types may contain context types or context instances. Schemas are built
+        from an instance, so they are skipped for context types that cannot be
+        constructed without arguments.
+        """
+        contexts = []
+        for ctx in ctx_types:
+            if isinstance(ctx, Context):
+                contexts.append((type(ctx), ctx))
+            else:
+                contexts.append((ctx, _default_context(ctx)))
+        stats = {}
+        queue = deque(types)
+        while queue:
+            t = queue.popleft()
+            if t in stats:
+                continue
+            stats[t] = timings = {}
+            start = time.perf_counter()
+            queue.extend(subtypes(t))
+            timings["model"] = time.perf_counter() - start
+            for direction in directions:
+                start = time.perf_counter()
+                for ctx_t, ctx in contexts:
+                    if direction == "schema":
+                        if ctx is not None:
+                            self.schema(t, ctx)
+                        continue
+                    method = getattr(self, direction)
+                    for it in _precompile_input_types(t, direction):
+                        method.resolve(type[t], it, ctx_t)
+                timings[direction] = time.perf_counter() - start
+        return stats
+
     ##################
     # Global helpers #
     ##################
@@ -107,33 +294,42 @@ class BaseImplementation(Medley):
             acc2 = Code("__TMP")
 
         if validate is None:
-            validate = getattr(cls, f"validate_{method_name}")
+            validate = getattr(cls, f"validate_{method_name}") and not issubclass(ctx_t, Trusted)
         method = getattr(cls, method_name)
-        if ec := getattr(cls, f"{method_name}_embed_condition")(t):
-            ec = All[ec]
-        if ec is not None:
+        if (et := getattr(cls, f"{method_name}_embed_condition")(t)) is not None:
             try:
-                fn = method.resolve(type[t], ec, ctx_t, after=after)
-                cg = getattr(fn, "__codegen__", None)
-                if cg:
-                    body = cg.create_expression([None, t, accessor, ctx_expr])
-                    ot = get_origin(t) or t
+                fn = method.resolve(type[t], All[et], ctx_t, after=after)
+                cg = generated_code(fn)
+                args = [None, t, accessor, ctx_expr]
+                if isinstance(cg, Guarded) and validate and isinstance(accessor, str):
+                    return Code(
+                        "$value if $guard else $recurse($self, $t, $acc, $ctx_expr)",
+                        value=Code(inline_expression(cg.value, args)),
+                        guard=Code(inline_expression(cg.guard, args)),
+                        acc=acc2,
+                        t=t,
+                        recurse=method,
+                        ctx_expr=ctx_expr,
+                    )
+                elif cg:
+                    body = inline_expression(cg, args)
                     if not validate:
                         return Code(body)
                     else:
                         return Code(
-                            "$body if type($acc1) is $t else $recurse($self, $t, $acc2, $ctx_expr)",
+                            "$body if type($acc1) is $et else $recurse($self, $t, $acc2, $ctx_expr)",
                             body=Code(body),
                             acc1=acc1,
                             acc2=acc2,
-                            t=ot,
+                            et=et,
+                            t=t,
                             recurse=method,
                             ctx_expr=ctx_expr,
                         )
-            except (CodegenInProgress, ValueError):  # pragma: no cover
-                # This is important if we are going to inline recursively
-                # a type that refers to itself down the line.
-                # We currently never do that.
+            except (CodegenInProgress, ValueError):
+                # The code for t is a Def, which cannot be inlined (e.g. Paths relative
+                # to a WorkingDirectory), or t refers back to a type whose code is
+                # being generated, so it is called through the dispatch map instead
                 pass
         return Code(
             "$method_map[$tt, type($acc1), $ctxt]($self, $t, $acc2, $ctx_expr)",
@@ -142,7 +338,7 @@ class BaseImplementation(Medley):
             t=t,
             acc1=acc1,
             acc2=acc2,
-            method_map=method.map,
+            method_map=dispatch_map(method),
             ctx_expr=ctx_expr,
         )
 
@@ -154,6 +350,10 @@ class BaseImplementation(Medley):
     def serialize_embed_condition(cls, t):
         if t in (int, str, bool, float, NoneType):
             return t
+        elif t in _string_types:
+            return _ConcretePath if t is Path else t
+        elif isinstance(t, type) and issubclass(t, Enum):
+            return t
 
     @ovld(priority=MIN)
     def serialize(self, t: Any, obj: Any, ctx: Context, /):
@@ -181,7 +381,21 @@ class BaseImplementation(Medley):
     # deserialize: helpers and entry points #
     #########################################
 
-    deserialize_embed_condition = serialize_embed_condition
+    @classmethod
+    def deserialize_embed_condition(cls, t):
+        if t in (int, str, bool, float, NoneType):
+            return t
+        elif t is Path:
+            # Parsing dates, durations and time zones can fail, so they are not inlined:
+            # errors have to be raised from their own frame to be located properly
+            return str
+        elif get_origin(t) is Literal or (isinstance(t, type) and issubclass(t, Enum)):
+            # The Guarded code of Literals and Enums checks the input itself, but the
+            # options must have a single type to know which code the input goes to
+            options = get_args(t) if get_origin(t) is Literal else [e.value for e in t]
+            match list({type(o) for o in options}):
+                case [ot]:
+                    return ot
 
     @ovld(priority=MIN)
     def deserialize(self, t: Any, obj: Any, ctx: Context, /):
@@ -221,15 +435,29 @@ class BaseImplementation(Medley):
     @ovld(priority=MAX)
     def schema(self, t: Any, ctx: Context, /):
         key = (t, type(ctx))
-        if key not in self._schema_cache:
-            self._schema_cache[key] = holder = Schema(t)
+        if (holder := self._schema_cache.get(key, None)) is not None:
+            return holder
+        with self._schema_lock:
+            if (holder := self._schema_cache.get(key, None)) is not None:
+                return holder
+            if (holder := self._schema_pending.get(key, None)) is not None:
+                return holder
+            # Schemas may refer to pending (incomplete) ones, so they are all published
+            # at once when the outermost one is complete
+            outermost = not self._schema_pending
+            self._schema_pending[key] = holder = Schema(t)
             try:
-                result = call_next(t, ctx)
+                holder.update(call_next(t, ctx))
             except Exception:
-                del self._schema_cache[key]
+                if outermost:
+                    self._schema_pending.clear()
+                else:
+                    del self._schema_pending[key]
                 raise
-            holder.update(result)
-        return self._schema_cache[key]
+            if outermost:
+                self._schema_cache.update(self._schema_pending)
+                self._schema_pending.clear()
+        return holder
 
     @ovld(priority=LO5)
     def schema(self, t: Indirect | TypeAliasType, ctx: Context, /):  # pragma: no cover
@@ -501,7 +729,7 @@ class BaseImplementation(Medley):
             parts=[Code(a) for a in args],
         )
         stmts.append(final)
-        return Def(stmts, VE=ValidationError)
+        return ModelLoader(stmts, VE=ValidationError)
 
     ######################################
     # Implementations: StringModelizable #
@@ -523,13 +751,24 @@ class BaseImplementation(Medley):
         (t,) = get_args(t)
         m = model(t)
         if m.regexp:
+            descr = m.string_description or f"pattern {m.regexp.pattern!r}"
             if isinstance(m.from_string, Def):  # pragma: no cover
                 raise Exception("In model definitions, use Lambda with regexp, not Def")
             elif isinstance(m.from_string, Lambda):
-                expr = m.from_string.create_expression(["t", "obj", "ctx"])
+                expr = inline_expression(m.from_string, ["t", "obj", "ctx"])
             else:
-                expr = Code("$from_string($obj)", from_string=m.from_string)
-            descr = m.string_description or f"pattern {m.regexp.pattern!r}"
+
+                def invalid(obj):
+                    raise ValidationError(
+                        f"String {obj!r} is not a valid {clsstring(t)}. It should match: {descr}"
+                    )
+
+                return Lambda(
+                    "$from_string($obj) if $regexp.match($obj) else $invalid($obj)",
+                    from_string=m.from_string,
+                    regexp=m.regexp,
+                    invalid=invalid,
+                )
             pattern = f"String {{$obj!r}} is not a valid {clsstring(t)}. It should match: {descr}"
             return Def(
                 Code(
@@ -667,6 +906,60 @@ class BaseImplementation(Medley):
             )
         return Lambda(code)
 
+    @classmethod
+    def __union_dispatch_table(cls, default, rest, obj, ctx):
+        """Dispatch on a single dict lookup rather than a chain of conditions.
+
+        The options in rest are tested in reverse order, each on its cheapest tell, and
+        default is used if none match. This returns None if the tells do not allow the
+        same choice to be made with a table.
+        """
+        method_map = dispatch_map(cls.deserialize)
+        ctx_t = ctx
+
+        def entry(opt):
+            return (subtler_type(opt), opt)
+
+        ordered = list(reversed(rest))
+        dflt = entry(default)
+
+        keys = {tl.key if type(tl) is KeyValueTell else None for _, tls in ordered for tl in tls}
+        if len(keys) == 1 and None not in keys:
+            (key,) = keys
+            by_value = {}
+            for opt, tls in ordered:
+                for tl in tls:
+                    by_value.setdefault(tl.value, entry(opt))
+
+            def dispatch(self, obj, ctx):
+                try:
+                    tt, opt = by_value.get(obj[key], dflt) if key in obj else dflt
+                except TypeError:  # unhashable value
+                    tt, opt = dflt
+                return method_map[tt, type(obj), ctx_t](self, opt, obj, ctx)
+
+        elif all(type(min(tls)) is KeyTell for _, tls in ordered):
+            # If several options are checked for the same key, the first one wins
+            rank = {}
+            entries = []
+            for opt, tls in ordered:
+                if (k := min(tls).key) not in rank:
+                    rank[k] = len(entries)
+                    entries.append(entry(opt))
+
+            def dispatch(self, obj, ctx):
+                best = None
+                for k in obj:
+                    if (r := rank.get(k, None)) is not None and (best is None or r < best):
+                        best = r
+                tt, opt = dflt if best is None else entries[best]
+                return method_map[tt, type(obj), ctx_t](self, opt, obj, ctx)
+
+        else:
+            return None
+
+        return Lambda("$dispatch($self, $obj, $ctx)", dispatch=dispatch)
+
     @code_generator(priority=STD)
     def deserialize(cls, t: type[UnionAlias] | type[UnionType], obj: Any, ctx: Context, /):
         (t,) = get_args(t)
@@ -699,6 +992,10 @@ class BaseImplementation(Medley):
 
         (o1, _), *rest = tells
 
+        if issubclass(obj, dict) and len(rest) > 2:
+            if (table := cls.__union_dispatch_table(o1, rest, obj, ctx)) is not None:
+                return table
+
         code = cls.subcode("deserialize", o1, "$obj", ctx)
         for opt, tls in rest:
             code = Code(
@@ -753,7 +1050,17 @@ class BaseImplementation(Medley):
     @code_generator(priority=STD3)
     def deserialize(cls, t: type[Enum], obj: Any, ctx: Context, /):
         (t,) = get_args(t)
-        return Lambda(Code("$t($obj)", t=t))
+        members = {e.value: e for e in t}
+        # The type check ensures the value is hashable; anything else goes through the
+        # constructor, which also handles aliases and _missing_
+        return Guarded(
+            "type($obj) in $vtypes and $obj in $members",
+            "$members[$obj]",
+            "$t($obj)",
+            members=members,
+            vtypes=frozenset(type(v) for v in members),
+            t=t,
+        )
 
     @ovld(priority=STD3)
     def schema(self, t: type[Enum], ctx: Context, /):
@@ -763,19 +1070,42 @@ class BaseImplementation(Medley):
     # Implementations: Literal Enums #
     ##################################
 
-    @ovld(priority=STD)
-    def serialize(self, t: type[IsLiteral], obj: Any, ctx: Context, /):
+    @classmethod
+    def __generic_codegen_literal(cls, t, obj, ctx):
+        (t,) = get_args(t)
         options = get_args(t)
-        if obj not in options:
-            raise ValidationError(f"'{obj}' is not a valid option for {t}", ctx=ctx)
-        return obj
 
-    @ovld(priority=STD)
-    def deserialize(self, t: type[IsLiteral], obj: Any, ctx: Context, /):
-        options = get_args(t)
-        if obj not in options:
-            raise ValidationError(f"'{obj}' is not a valid option for {t}", ctx=ctx)
-        return obj
+        def check_option(obj, ctx):
+            if obj not in options:
+                raise ValidationError(f"'{obj}' is not a valid option for {t}", ctx=ctx)
+            return obj
+
+        # The type check ensures the value is hashable; anything else is checked against
+        # the options one by one
+        return Guarded(
+            "type($obj) in $otypes and $obj in $optset",
+            "$obj",
+            "$check($obj, $ctx)",
+            otypes=frozenset(type(o) for o in options),
+            optset=frozenset(options),
+            check=check_option,
+        )
+
+    @code_generator(priority=STD)
+    def serialize(cls, t: type[IsLiteral], obj: Any, ctx: Context, /):
+        return cls.__generic_codegen_literal(t, obj, ctx)
+
+    @code_generator(priority=STD)
+    def deserialize(cls, t: type[IsLiteral], obj: Any, ctx: Context, /):
+        return cls.__generic_codegen_literal(t, obj, ctx)
+
+    @code_generator(priority=STD(1))
+    def serialize(cls, t: type[IsLiteral], obj: Any, ctx: Trusted, /):
+        return Lambda(Code("$obj"))
+
+    @code_generator(priority=STD(1))
+    def deserialize(cls, t: type[IsLiteral], obj: Any, ctx: Trusted, /):
+        return Lambda(Code("$obj"))
 
     @ovld(priority=STD)
     def schema(self, t: type[IsLiteral], ctx: Context, /):
@@ -804,18 +1134,28 @@ class BaseImplementation(Medley):
     # Implementations: Path #
     #########################
 
-    @ovld(priority=STD)
-    def serialize(self, t: type[Path], obj: Path, ctx: Context):
-        if isinstance(ctx, WorkingDirectory) and not obj.is_absolute():
-            obj = obj.relative_to(ctx.directory)
-        return str(obj)
+    @code_generator(priority=STD)
+    def serialize(cls, t: type[Path], obj: Path, ctx: Context, /):
+        if issubclass(ctx, WorkingDirectory):
+            # relative_to can fail, and a Def is not inlined in enclosing code, so that
+            # the error is raised from this frame and located properly
+            return Def(
+                Code(
+                    [
+                        ["if $obj.is_absolute():", ["return str($obj)"]],
+                        ["try:", ["return str($obj.relative_to($ctx.directory))"]],
+                        ["except ValueError as exc:", ["raise $VE(exc=exc, ctx=$ctx)"]],
+                    ]
+                ),
+                VE=ValidationError,
+            )
+        return Lambda("str($obj)")
 
-    @ovld(priority=STD)
-    def deserialize(self, t: type[Path], obj: str, ctx: Context):
-        pth = Path(obj).expanduser()
-        if isinstance(ctx, WorkingDirectory):
-            pth = ctx.directory / pth
-        return pth
+    @code_generator(priority=STD)
+    def deserialize(cls, t: type[Path], obj: str, ctx: Context, /):
+        if issubclass(ctx, WorkingDirectory):
+            return Lambda("$ctx.directory / $Path($obj).expanduser()", Path=Path)
+        return Lambda("$Path($obj).expanduser()", Path=Path)
 
     @ovld(priority=STD)
     def schema(self, t: type[Path], ctx: Context, /):
@@ -846,6 +1186,50 @@ class BaseImplementation(Medley):
             raise ValidationError(msg, ctx=ctx)
         return recurse(Annotated[t, Auto(call=False, embed_self=False, force=True)], ctx)
 
+    ##########################
+    # Implementations: Batch #
+    ##########################
+
+    @classmethod
+    def __generic_codegen_batch(cls, method, t, objs, ctx):
+        (t,) = get_args(t)
+        if method == "serialize":
+            it = get_origin(t) or t
+            if not isinstance(it, type) or it is UnionType:
+                # Unions and Literals are dispatched on the type of each element
+                it = None
+        else:
+            it = _deserialize_input_type(t)
+        if it is None:
+            return Lambda("[$body for X in $objs]", body=cls.subcode(method, t, "X", ctx))
+
+        fn = getattr(cls, method).resolve(type[t], it, ctx)
+        body = None
+        if cg := generated_code(fn):
+            try:
+                body = Code(inline_expression(cg, [None, t, "X", Code("$ctx")]))
+            except ValueError:
+                # The generated code is a Def, which cannot be inlined
+                pass
+        if body is None:
+            body = Code("$fn($self, $t, X, $ctx)", fn=fn)
+        if getattr(cls, f"validate_{method}") and not issubclass(ctx, Trusted):
+            body = Code(
+                "$body if type(X) is $it else $recurse($self, $t, X, $ctx)",
+                body=body,
+                it=it,
+                recurse=getattr(cls, method),
+            )
+        return Lambda("[$body for X in $objs]", body=body)
+
+    @code_generator(priority=STD)
+    def serialize_batch(cls, t: type[Any], objs: Any, ctx: Context, /):
+        return cls.__generic_codegen_batch("serialize", t, objs, ctx)
+
+    @code_generator(priority=STD)
+    def deserialize_batch(cls, t: type[Any], objs: Any, ctx: Context, /):
+        return cls.__generic_codegen_batch("deserialize", t, objs, ctx)
+
     ##########################################
     # Implementations: Standard instructions #
     ##########################################
@@ -901,3 +1285,7 @@ class BaseImplementation(Medley):
 
         else:
             return _noop
+
+    @code_generator(priority=LOW(1))
+    def process_extra_fields(self, t: type[Any], obj: dict, ctx: Trusted):
+        return _noop
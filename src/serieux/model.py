@@ -1,4 +1,5 @@
 import re
+import threading
 from dataclasses import MISSING, dataclass, field, fields, is_dataclass, replace
 from datetime import date, datetime, timedelta
 from functools import cached_property
@@ -19,7 +20,7 @@ from ovld import Dataclass, Lambda, call_next, class_check, ovld, recurse, subcl
 from .docstrings import VariableDoc, get_attribute_docstrings
 from .exc import ValidationError
 from .instructions import Instruction, T, inherit, pushdown, strip
-from .utils import UnionAlias, clsstring, evaluate_hint
+from .utils import Indirect, TypeAliasType, UnionAlias, clsstring, evaluate_hint
 
 UNDEFINED = object()
 
@@ -146,13 +147,17 @@ def constructed_type(t):
             return m.constructed_type
 
 
+# Only complete models are put in _model_cache, so that it can be read without locking.
+# Models under construction are in _building, which is only used under _model_lock.
 _model_cache = {}
+_building = {}
 _premade = {}
+_model_lock = threading.RLock()
 
 
 def _take_premade(t):
-    _model_cache[t] = _premade.pop(t)
-    return _model_cache[t]
+    _building[t] = _premade.pop(t)
+    return _building[t]
 
 
 #########
@@ -163,17 +168,38 @@ def _take_premade(t):
 @ovld(priority=100)
 def model(t: type[Any]):
     t = evaluate_hint(t)
-    if t not in _model_cache:
+    if (m := _model_cache.get(t, UNDEFINED)) is not UNDEFINED:
+        return m
+    with _model_lock:
+        if (m := _model_cache.get(t, UNDEFINED)) is not UNDEFINED:
+            return m
+        if (m := _building.get(t, UNDEFINED)) is not UNDEFINED:
+            return m
+        # Models may refer to incomplete ones, so they are all published at once when
+        # the outermost one is complete
+        outermost = not _building
         _premade[t] = Model(
             original_type=t,
             fields=[],
             constructor=None,
         )
-        m = _model_cache[t] = call_next(t)
-        if isinstance(cfg := getattr(t, "SerieuxConfig", None), type):
-            if (ae := getattr(cfg, "allow_extras", None)) is not None:
-                m.allow_extras = ae
-    return _model_cache[t]
+        try:
+            m = _building[t] = call_next(t)
+            if isinstance(cfg := getattr(t, "SerieuxConfig", None), type):
+                if (ae := getattr(cfg, "allow_extras", None)) is not None:
+                    m.allow_extras = ae
+        except Exception:
+            if outermost:
+                _building.clear()
+            else:
+                _building.pop(t, None)
+            raise
+        finally:
+            _premade.pop(t, None)
+        if outermost:
+            _model_cache.update(_building)
+            _building.clear()
+    return m
 
 
 def safe_isinstance(obj, t):
@@ -293,31 +319,40 @@ def _timedelta_to_string(obj: timedelta):
         return f"{seconds}s"
 
 
+_timedelta_units = {
+    "d": "days",
+    "h": "hours",
+    "m": "minutes",
+    "s": "seconds",
+    "ms": "milliseconds",
+    "us": "microseconds",
+}
+_timedelta_split = re.compile("([a-z ]+)")
+
+
 def _timedelta_from_string(obj: str):
     """Deserialize a combination of days, hours, etc. as a timedelta."""
-    units = {
-        "d": "days",
-        "h": "hours",
-        "m": "minutes",
-        "s": "seconds",
-        "ms": "milliseconds",
-        "us": "microseconds",
-    }
     sign = 1
     if obj.startswith("-"):
         obj = obj[1:]
         sign = -1
+    # Fast path for the output of _timedelta_to_string
+    if obj.endswith("us"):
+        if obj[:-2].isdecimal():
+            return timedelta(microseconds=sign * int(obj[:-2]))
+    elif obj.endswith("s") and obj[:-1].isdecimal():
+        return timedelta(seconds=sign * int(obj[:-1]))
     kw = {}
-    parts = re.split(string=obj, pattern="([a-z ]+)")
+    parts = _timedelta_split.split(obj)
     assert parts[-1] == ""
     for i in range(len(parts) // 2):
         n = parts[i * 2]
         unit = parts[i * 2 + 1].strip()
-        assert unit in units
+        assert unit in _timedelta_units
         try:
-            kw[units[unit]] = float(n)
+            kw[_timedelta_units[unit]] = float(n)
         except ValueError:
-            raise ValidationError(f"Could not convert '{n}' ({units[unit]}) to float")
+            raise ValidationError(f"Could not convert '{n}' ({_timedelta_units[unit]}) to float")
     return sign * timedelta(**kw)
 
 
@@ -410,3 +445,39 @@ def field_at(t: type[UnionAlias], path: list, f: Field):
 @ovld(priority=-1)
 def field_at(t: Any, path: list, f: Field):
     return None
+
+
+############
+# subtypes #
+############
+
+
+@ovld
+def subtypes(t: type[Modelizable]):
+    m = model(t)
+    rval = [f.type for f in m.fields or []]
+    if m.element_field is not None:
+        rval.append(m.element_field.type)
+    return rval
+
+
+@ovld
+def subtypes(t: type[dict] | type[UnionAlias]):
+    return list(get_args(t))
+
+
+@ovld(priority=-1)
+def subtypes(t: type[Annotated]):
+    if (pt := pushdown(t)) != t:
+        return [pt]
+    return []
+
+
+@ovld
+def subtypes(t: Indirect | TypeAliasType):
+    return [t.__value__]
+
+
+@ovld(priority=-2)
+def subtypes(t: object):
+    return []
@@ -0,0 +1,113 @@
+from array import array
+
+import pytest
+
+from serieux import Columnar, Trail, deserialize, dump, load, schema, serialize
+from serieux.exc import MissingFieldError, UnrecognizedFieldError, ValidationError
+
+from ..definitions import Defaults, Job, Point
+
+
+def test_serialize_columnar():
+    points = [Point(1, 2), Point(3, 4), Point(5, 6)]
+    assert serialize(Columnar[list[Point]], points) == {"x": [1, 3, 5], "y": [2, 4, 6]}
+
+
+def test_deserialize_columnar():
+    data = {"x": [1, 3, 5], "y": [2, 4, 6]}
+    points = [Point(1, 2), Point(3, 4), Point(5, 6)]
+    assert deserialize(Columnar[list[Point]], data) == points
+
+
+def test_deserialize_columnar_rows():
+    # The row-wise layout is still accepted
+    data = [{"x": 1, "y": 2}]
+    assert deserialize(Columnar[list[Point]], data) == [Point(1, 2)]
+
+
+def test_columnar_empty():
+    assert serialize(Columnar[list[Point]], []) == {"x": [], "y": []}
+    assert deserialize(Columnar[list[Point]], {"x": [], "y": []}) == []
+
+
+def test_columnar_arrays():
+    data = serialize(Columnar(arrays=True)[list[Point]], [Point(1, 2), Point(3, 4)])
+    assert data == {"x": array("q", [1, 3]), "y": array("q", [2, 4])}
+    assert deserialize(Columnar[list[Point]], data) == [Point(1, 2), Point(3, 4)]
+
+
+def test_columnar_arrays_msgpack(tmp_path):
+    dest = tmp_path / "points.msgpack"
+    points = [Point(1, 2), Point(3, 4)]
+    dump(Columnar(arrays=True)[list[Point]], points, dest=dest)
+    assert load(Columnar[list[Point]], dest) == points
+
+
+def test_columnar_arrays_bad_bytes():
+    with pytest.raises(ValidationError, match="multiple of item size"):
+        deserialize(Columnar[list[Point]], {"x": b"\x01\x02\x03", "y": b"\x01\x02\x03"})
+
+
+def test_columnar_arrays_text_format():
+    with pytest.raises(ValidationError, match="Cannot write the serialized data as JSON"):
+        dump(Columnar(arrays=True)[list[Point]], [Point(1, 2)], format="json")
+
+
+def test_columnar_defaults():
+    data = {"name": ["a", "b"], "cool": [True, False]}
+    assert deserialize(Columnar[list[Defaults]], data) == [
+        Defaults(name="a", cool=True),
+        Defaults(name="b", cool=False),
+    ]
+
+
+def test_columnar_missing_column():
+    with pytest.raises(MissingFieldError):
+        deserialize(Columnar[list[Point]], {"x": [1, 2]})
+
+
+def test_columnar_unequal_lengths():
+    with pytest.raises(ValidationError, match="same length"):
+        deserialize(Columnar[list[Point]], {"x": [1, 2], "y": [3]})
+
+
+def test_columnar_extra_column():
+    with pytest.raises(UnrecognizedFieldError):
+        deserialize(Columnar[list[Point]], {"x": [1], "y": [2], "z": [3]})
+
+
+def test_columnar_schema():
+    assert schema(Columnar[list[Point]]).compile(root=False) == {
+        "type": "object",
+        "properties": {
+            "x": {"type": "array", "items": {"type": "integer"}},
+            "y": {"type": "array", "items": {"type": "integer"}},
+        },
+        "required": ["x", "y"],
+        "additionalProperties": False,
+    }
+
+
+@pytest.mark.parametrize("lt", [set[Job], frozenset[Job]])
+def test_columnar_other_lists(lt):
+    jobs = lt.__origin__([Job("cook", 30000.0), Job("clerk", 40000.0)])
+    data = serialize(Columnar[lt], jobs)
+    assert sorted(data["title"]) == ["clerk", "cook"]
+    result = deserialize(Columnar[lt], data)
+    assert type(result) is lt.__origin__
+    assert result == jobs
+
+
+def test_serialize_columnar_wrong_element():
+    with pytest.raises(ValidationError, match="Cannot serialize object of type 'int'") as exc:
+        serialize(Columnar[list[Point]], [Point(1, 2), 3], Trail())
+    assert exc.value.ctx.trail == (1,)
+
+
+@pytest.mark.parametrize("ctx", [Trail(), None])
+def test_deserialize_columnar_wrong_element(ctx):
+    data = {"x": [1, 3, 5], "y": [2, "four", 6]}
+    args = (ctx,) if ctx else ()
+    with pytest.raises(ValidationError, match="Cannot deserialize string") as exc:
+        deserialize(Columnar[list[Point]], data, *args)
+    assert exc.value.ctx.trail == ("y", 1)
@@ -0,0 +1,95 @@
+import json
+from dataclasses import dataclass, field
+
+import pytest
+
+from serieux import Serieux
+from serieux.exc import SerieuxError, ValidationError
+from serieux.features.fromfile import IncludeFile
+from serieux.features.fused import FusedDecoding, typed_decoder
+
+from ..definitions import Citizen, Color, Defaults, Point, World
+
+deserialize = (Serieux + IncludeFile)().deserialize
+generic = (Serieux + IncludeFile - FusedDecoding)()
+
+
+@dataclass
+class Holder:
+    points: list[Point]
+    names: dict[str, str]
+    extra: Point | None = None
+    tags: list[str] = field(default_factory=list)
+
+
+@dataclass
+class WithColor:
+    color: Color
+
+
+@dataclass
+class Custom:
+    x: int
+
+    @classmethod
+    def serieux_deserialize(cls, obj, ctx, call_next):
+        return cls(x=obj["x"] * 2)
+
+
+world_data = {
+    "countries": {
+        "canada": {
+            "languages": ["English", "French"],
+            "capital": "Ottawa",
+            "population": 39_000_000,
+            "citizens": [{"name": "Olivier", "birthyear": 1985, "hometown": "Montreal"}],
+        }
+    }
+}
+
+
+def test_typed_decoder_eligibility():
+    impl = Serieux()
+    assert typed_decoder(impl, World) is not None
+    assert typed_decoder(impl, Holder) is not None
+    assert typed_decoder(impl, Defaults) is not None
+    assert typed_decoder(impl, list[Citizen]) is not None
+    assert typed_decoder(impl, WithColor) is None
+    assert typed_decoder(impl, Custom) is None
+
+
+@pytest.mark.parametrize(
+    "t,data",
+    [
+        (World, world_data),
+        (Holder, {"points": [{"x": 1, "y": 2}], "names": {"a": "b"}}),
+        (Holder, {"points": [], "names": {}, "extra": {"x": 1, "y": 2}, "tags": ["z"]}),
+        (Defaults, {"name": "x"}),
+        (list[Citizen], [{"name": "Olivier", "birthyear": 1985, "hometown": "Montreal"}]),
+        (WithColor, {"color": "red"}),
+        (Custom, {"x": 2}),
+    ],
+)
+def test_fused_same_as_generic(tmp_path, t, data):
+    file = tmp_path / "data.json"
+    file.write_text(json.dumps(data))
+    assert deserialize(t, file) == generic.deserialize(t, file)
+
+
+def test_fused_extra_fields(tmp_path):
+    file = tmp_path / "data.json"
+    file.write_text(json.dumps({"x": 1, "y": 2, "z": 3}))
+    with pytest.raises(SerieuxError, match="unrecognized fields"):
+        deserialize(Point, file)
+
+
+def test_fused_type_error(tmp_path):
+    file = tmp_path / "data.json"
+    file.write_text(json.dumps({"x": 1, "y": "two"}))
+    with pytest.raises(ValidationError, match="Cannot deserialize string 'two'"):
+        deserialize(Point, file)
+
+
+def test_fused_falls_back_on_include(datapath):
+    file = datapath / "world.json"
+    assert deserialize(World, file) == deserialize(World, file.with_suffix(".yaml"))
@@ -0,0 +1,97 @@
+import pickle
+from dataclasses import dataclass
+
+import numpy as np
+import pytest
+
+from serieux import Serieux
+from serieux.ctx import Binary
+from serieux.exc import ValidationError
+from serieux.features.numpy import NumpyArrays
+
+featured = (Serieux + NumpyArrays)()
+serialize = featured.serialize
+deserialize = featured.deserialize
+schema = featured.schema
+
+
+@dataclass
+class Image:
+    name: str
+    pixels: np.ndarray
+
+
+def test_roundtrip():
+    arr = np.arange(12, dtype=np.float32).reshape(3, 4)
+    data = serialize(np.ndarray, arr)
+    assert data["dtype"] == "<f4"
+    assert data["shape"] == [3, 4]
+    assert isinstance(data["data"], str)
+    result = deserialize(np.ndarray, data)
+    assert result.dtype == arr.dtype
+    assert np.array_equal(result, arr)
+
+
+def test_roundtrip_non_contiguous():
+    arr = np.arange(12).reshape(3, 4)[:, 1]
+    assert np.array_equal(deserialize(np.ndarray, serialize(np.ndarray, arr)), arr)
+
+
+def test_in_dataclass():
+    img = Image(name="x", pixels=np.zeros((2, 2), dtype=np.uint8))
+    result = deserialize(Image, serialize(Image, img))
+    assert result.name == "x"
+    assert np.array_equal(result.pixels, img.pixels)
+
+
+def test_binary_no_copy():
+    arr = np.arange(10, dtype=np.int64)
+    data = serialize(np.ndarray, arr, Binary())
+    assert isinstance(data["data"], pickle.PickleBuffer)
+    result = deserialize(np.ndarray, data)
+    # The result shares its memory with the original array
+    assert np.shares_memory(result, arr)
+
+
+def test_pickle_roundtrip(tmp_path):
+    img = Image(name="x", pixels=np.arange(6, dtype=np.float64).reshape(2, 3))
+    dest = tmp_path / "img.pkl"
+    featured.dump(Image, img, dest=dest)
+    result = featured.load(Image, dest)
+    assert np.array_equal(result.pixels, img.pixels)
+
+
+def test_pickle_loads_do_not_share_memory(tmp_path):
+    dest = tmp_path / "arr.pkl"
+    featured.dump(np.ndarray, np.arange(6), dest=dest)
+    a = featured.load(np.ndarray, dest)
+    b = featured.load(np.ndarray, dest)
+    assert not np.shares_memory(a, b)
+
+
+def test_deserialize_from_list():
+    result = deserialize(np.ndarray, [[1, 2], [3, 4]])
+    assert np.array_equal(result, np.array([[1, 2], [3, 4]]))
+
+
+def test_bad_shape():
+    data = serialize(np.ndarray, np.arange(6))
+    data["shape"] = [4, 2]
+    with pytest.raises(ValidationError):
+        deserialize(np.ndarray, data)
+
+
+def test_missing_field():
+    with pytest.raises(ValidationError, match="data"):
+        deserialize(np.ndarray, {"dtype": "<i8", "shape": [1]})
+
+
+def test_object_dtype():
+    with pytest.raises(ValidationError, match="dtype"):
+        serialize(np.ndarray, np.array([object()]))
+
+
+def test_schema():
+    sch = schema(np.ndarray).compile(root=False)
+    assert sch["required"] == ["dtype", "shape", "data"]
+    assert sch["properties"]["data"] == {"type": "string", "contentEncoding": "base64"}
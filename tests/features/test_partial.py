@@ -12,10 +12,13 @@ from serieux.features.partial import (
     NOT_GIVEN,
     AllTrails,
     Override,
+    ParallelSources,
     Partial,
     PartialBuilding,
     Sources,
+    partial_class,
 )
+from serieux.model import model
 
 from ..common import validation_errors
 from ..definitions import Defaults, Elf, Player, Point
@@ -44,6 +47,48 @@ def test_three_sources():
     assert load(Point, Sources({"x": 1}, {"y": 2}, {"x": 3})) == Point(3, 2)
 
 
+@dataclass
+class Locals:
+    a: int
+    b: int
+    args: str
+    merge: str = "m"
+
+
+def test_field_names_shadowing_locals():
+    sources = Sources({"a": 1, "args": "x"}, {"b": 2, "a": 3})
+    assert load(Locals, sources) == Locals(a=3, b=2, args="x")
+
+
+def test_partial_class_identity():
+    pcls = partial_class(Point)
+    assert partial_class(Point) is pcls
+    assert model(Partial[Point]).original_type is pcls
+    assert type(load(Partial[Point], {"x": 1})) is pcls
+
+
+def test_merge_plan():
+    one = load(Partial[Point], {"x": 1})
+    two = load(Partial[Point], {"x": 2, "y": 3})
+    merged = type(one)._merge(one, two)
+    assert (merged.x, merged.y) == (2, 3)
+    assert type(one)._instantiate(merged) == Point(2, 3)
+
+
+def test_merge_plan_errors():
+    one = load(Partial[Point], {"x": 1, "y": "oops"})
+    two = load(Partial[Point], {"x": "oh"})
+    merged = type(one)._merge(one, two)
+    assert isinstance(merged.x, ValidationError)
+    assert isinstance(merged.y, ValidationError)
+    assert len(type(one)._instantiate(merged).exceptions) == 2
+
+
+def test_parallel_sources():
+    srcs = Sources({"x": 1}, {"y": 2}, {"x": 3}, {"y": 4}, {"x": 5})
+    assert load(Point, srcs, ParallelSources(max_workers=2)) == Point(5, 4)
+
+
 def test_complicated_partial():
     d = load(
         dict[str, Point | str],
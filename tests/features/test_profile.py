@@ -0,0 +1,64 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from serieux import Serieux
+from serieux.features.partial import Sources
+from serieux.features.profile import Profile, Profiling
+
+from ..definitions import Citizen, Country, Point, World
+
+srx = (Serieux + Profiling)()
+
+
+def test_profile_deserialize():
+    prof = Profile()
+    assert srx.deserialize(Point, {"x": 1, "y": 2}, prof) == Point(1, 2)
+    assert prof.timings[("deserialize", Point)][0] == 1
+    assert ("deserialize:Point",) in prof.stacks
+
+
+def test_profile_nested():
+    prof = Profile()
+    world = World(
+        countries={
+            "canada": Country(
+                languages=["English", "French"],
+                capital="Ottawa",
+                population=39_000_000,
+                citizens=[Citizen(name="Olivier", birthyear=1985, hometown="Montreal")],
+            )
+        }
+    )
+    data = srx.serialize(World, world)
+    assert srx.deserialize(World, data, prof) == world
+    assert prof.timings[("deserialize", World)][0] == 1
+    assert any(len(stack) > 1 and stack[0] == "deserialize:World" for stack in prof.stacks)
+
+
+def test_profile_sources():
+    prof = Profile()
+    assert srx.deserialize(Point, Sources({"x": 1}, {"y": 2}), prof) == Point(1, 2)
+    assert ("PartialBuilding", "merge") in prof.timings
+    assert ("PartialBuilding", "instantiate") in prof.timings
+
+
+def test_profile_report(tmp_path):
+    prof = Profile()
+    srx.serialize(Point, Point(1, 2), prof)
+    lines = dict(line.rsplit(" ", 1) for line in prof.report().splitlines())
+    assert int(lines["serialize:Point"]) >= 0
+    assert int(lines["serialize:Point;serialize:int"]) >= 0
+    prof.dump_report(tmp_path / "profile.txt")
+    assert (tmp_path / "profile.txt").read_text() == prof.report()
+
+
+def test_profile_threads():
+    prof = Profile()
+
+    def measure(_):
+        for _ in range(1000):
+            with prof.measure("test", "x"):
+                pass
+
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(measure, range(8)))
+    assert prof.timings[("test", "x")][0] == 8000
@@ -0,0 +1,115 @@
+import os
+from dataclasses import dataclass
+
+import pytest
+
+from serieux import Sources, deserialize
+from serieux.exc import ValidationError
+from serieux.features.reload import Reloader
+
+from ..definitions import Point
+
+
+@dataclass
+class Config:
+    origin: Point
+    points: dict[str, Point]
+    name: str = "default"
+
+
+def write(path, text):
+    # Make sure the stamp changes even if the file system is coarse
+    mtime = path.stat().st_mtime_ns + 10**9 if path.exists() else None
+    path.write_text(text)
+    if mtime is not None:
+        os.utime(path, ns=(mtime, mtime))
+
+
+@pytest.fixture
+def files(tmp_path):
+    base = tmp_path / "base.yaml"
+    over = tmp_path / "over.yaml"
+    write(base, "origin: {x: 0, y: 0}\npoints: {a: {x: 1, y: 2}, b: {x: 3, y: 4}}\n")
+    write(over, "name: over\n")
+    return base, over
+
+
+def test_reload_same_as_deserialize(files):
+    r = Reloader(Config, files)
+    assert r.value == deserialize(Config, Sources(*files))
+    assert r.value.name == "over"
+
+
+def test_reload_unchanged(files):
+    r = Reloader(Config, files)
+    value = r.value
+    assert r.reload() == []
+    assert r.value is value
+    # Touching a file without changing its contents does not rebuild anything
+    write(files[0], files[0].read_text())
+    assert r.reload() == []
+    assert r.value is value
+
+
+def test_reload_changed_subtree(files):
+    base, over = files
+    r = Reloader(Config, files)
+    old = r.value
+    write(over, "name: over\npoints: {b: {x: 3, y: 5}}\n")
+    assert r.reload() == [("points", "b", "y")]
+    assert r.value.points["b"] == Point(3, 5)
+    assert r.value.points["a"] is old.points["a"]
+    assert r.value.origin is old.origin
+
+
+def test_reload_added_and_removed(files):
+    base, over = files
+    r = Reloader(Config, files)
+    write(over, "points: {c: {x: 5, y: 6}}\n")
+    assert sorted(r.reload()) == [("name",), ("points", "c")]
+    assert r.value.name == "default"
+    assert set(r.value.points) == {"a", "b", "c"}
+
+
+def test_reload_error_keeps_value(files):
+    base, over = files
+    r = Reloader(Config, files)
+    old = r.value
+    write(over, "origin: {x: oops}\n")
+    with pytest.raises(ValidationError):
+        r.reload()
+    assert r.value is old
+    write(over, "name: fixed\n")
+    assert r.reload() == [("name",)]
+    assert r.value.name == "fixed"
+
+
+def test_reload_static_sources(files):
+    base, _ = files
+    r = Reloader(Config, [base, {"name": "static"}])
+    assert r.value.name == "static"
+    assert r.reload() == []
+
+
+@dataclass
+class Tagged:
+    tags: list[str]
+    size: int
+
+    def __post_init__(self):
+        if self.size < 0:
+            raise ValueError("size must be positive")
+
+
+def test_reload_rebuild_keeps_lists_and_validates(tmp_path):
+    file = tmp_path / "tagged.yaml"
+    write(file, "tags: [a, b]\nsize: 1\n")
+    r = Reloader(Tagged, [file])
+    old = r.value
+    write(file, "tags: [a, b]\nsize: 2\n")
+    assert r.reload() == [("size",)]
+    assert r.value == Tagged(["a", "b"], 2)
+    assert r.value.tags is old.tags
+    write(file, "tags: [a, b]\nsize: -1\n")
+    with pytest.raises(ValidationError, match="size must be positive"):
+        r.reload()
@@ -56,6 +56,22 @@ def test_tunion_deserialize():
     assert deserialize(U, data) == Point(1, 2)
 
 
+def test_wide_tunion_deserialize():
+    U = (
+        Tagged[Player, "player"]
+        | Tagged[Point, "point"]
+        | Tagged[int, "nombre"]
+        | Tagged[str, "mot"]
+        | Tagged[Point, "pointe"]
+    )
+    assert deserialize(U, {tag_field: "point", "x": 1, "y": 2}) == Point(1, 2)
+    assert deserialize(U, {tag_field: "pointe", "x": 3, "y": 4}) == Point(3, 4)
+    assert deserialize(U, {tag_field: "nombre", value_field: 7}) == 7
+    assert deserialize(U, {tag_field: "mot", value_field: "seven"}) == "seven"
+    with pytest.raises(ValidationError):
+        deserialize(U, {tag_field: "wat", value_field: 7})
+
+
 def test_tagged_default_tag():
     def f():
         pass
@@ -5,7 +5,7 @@ from typing import Annotated, Any
 import pytest
 
 from serieux import Serieux, schema
-from serieux.exc import ValidationError
+from serieux.exc import UnrecognizedFieldError, ValidationError
 from serieux.features.dotted import DottedNotation
 from serieux.features.partial import Sources
 from serieux.features.tagset import (
@@ -13,7 +13,9 @@ from serieux.features.tagset import (
     ReferencedClass,
     TagDict,
     TaggedSubclass,
+    TagSet,
     TagSetFeature,
+    _ReferencedClass,
     tag_field,
 )
 
@@ -205,6 +207,54 @@ def test_tagged_subclass():
     assert deser == orig
 
 
+def test_tagged_subclass_resolved_once(monkeypatch):
+    ser = {tag_field: "tests.features.test_tagset:Wolf", "name": "Wolfie", "size": 10}
+    assert deserialize(TaggedSubclass[Animal], ser) == Wolf(name="Wolfie", size=10)
+    assert tag_field in ser
+
+    def fail(*args, **kwargs):  # pragma: no cover
+        raise AssertionError("The tag should not be resolved again")
+
+    monkeypatch.setattr(_ReferencedClass, "get_type", fail)
+    assert deserialize(TaggedSubclass[Animal], ser) == Wolf(name="Wolfie", size=10)
+
+
+def test_custom_tagset_not_cached():
+    calls = []
+
+    class Counted(TagSet):
+        def get_type(self, tag, ctx=None):
+            calls.append(tag)
+            return Wolf
+
+    t = Annotated[Animal, Counted()]
+    ser = {tag_field: "wolf", "name": "Wolfie", "size": 10}
+    assert deserialize(t, ser) == deserialize(t, ser) == Wolf(name="Wolfie", size=10)
+    assert calls == ["wolf", "wolf"]
+
+
+def test_tagged_extra_fields():
+    ser = {tag_field: "tests.features.test_tagset:Wolf", "name": "Wolfie", "size": 10}
+    with pytest.raises(UnrecognizedFieldError, match="'color'"):
+        deserialize(TaggedSubclass[Animal], {**ser, "color": "grey"})
+
+
+@dataclass
+class Fox:
+    name: str
+
+    @classmethod
+    def serieux_deserialize(cls, obj, ctx, call_next):
+        assert tag_field not in obj
+        return cls(name=obj["name"].upper())
+
+
+def test_tagged_custom_deserialize():
+    ser = {tag_field: "tests.features.test_tagset:Fox", "name": "Foxy"}
+    assert deserialize(TaggedSubclass[Fox], ser) == Fox(name="FOXY")
+    assert deserialize(TaggedSubclass[Fox], ser) == Fox(name="FOXY")
+
+
 def test_serialize_not_top_level():
     @dataclass
     class Lynx:
@@ -6,6 +6,7 @@ from serieux import Serieux, deserialize, serialize
 from serieux.ctx import Context
 
 from .definitions import Defaults, Point, World
+from .test_deserialize import Paint
 from .test_serialize import Special
 
 SEP = """
@@ -25,7 +26,7 @@ def test_serialize_codegen(cls, file_regression):
     file_regression.check(code)
 
 
-@pytest.mark.parametrize("cls", [Point, World, Defaults])
+@pytest.mark.parametrize("cls", [Point, World, Defaults, Paint])
 def test_deserialize_codegen(cls, file_regression):
     code = getcodes(deserialize, (type[cls], dict, Context))
     file_regression.check(code)
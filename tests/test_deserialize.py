@@ -1,6 +1,6 @@
 import sys
 import warnings
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Literal
@@ -8,7 +8,7 @@ from typing import Any, Literal
 import pytest
 
 from serieux import deserialize
-from serieux.ctx import ModifyContext, Trail, empty
+from serieux.ctx import ModifyContext, Trail, Trusted, WorkingDirectory, empty
 from serieux.exc import MissingFieldError, UnrecognizedFieldError, ValidationError, display
 from serieux.features.partial import Partial
 from serieux.model import AllowExtras
@@ -160,6 +160,33 @@ def test_deserialize_overlapping_union():
     assert type(deserialize(P, {"x": 1, "y": 2, "z": 3})) is Point3D
 
 
+@dataclass
+class Apple:
+    apple: int
+
+
+@dataclass
+class Banana:
+    banana: int
+
+
+@dataclass
+class Cherry:
+    cherry: int
+
+
+def test_deserialize_wide_union():
+    U = Point | Point3D | Apple | Banana | Cherry
+    assert type(deserialize(U, {"x": 1, "y": 2})) is Point
+    assert type(deserialize(U, {"x": 1, "y": 2, "z": 3})) is Point3D
+    assert deserialize(U, {"apple": 1}) == Apple(1)
+    assert deserialize(U, {"banana": 2}) == Banana(2)
+    assert deserialize(U, {"cherry": 3}) == Cherry(3)
+    # Falls back to the option without tells
+    with pytest.raises(MissingFieldError):
+        deserialize(U, {"durian": 4})
+
+
 def test_deserialize_defaults():
     data1 = {"name": "bob"}
     data2 = {"cool": True, "name": "alice"}
@@ -220,6 +247,34 @@ def test_deserialize_literal_mixed_enum():
         deserialize(lit, False)
 
 
+@dataclass
+class Paint:
+    color: Color
+    level: Level
+    finish: Literal["matte", "gloss"]
+
+
+def test_deserialize_enums_in_dataclass():
+    data = {"color": "red", "level": 2, "finish": "gloss"}
+    assert deserialize(Paint, data) == Paint(Color.RED, Level.HI, "gloss")
+    data = {"color": Color.BLUE, "level": Level.LO, "finish": "matte"}
+    assert deserialize(Paint, data) == Paint(Color.BLUE, Level.LO, "matte")
+    with pytest.raises(ValidationError, match=r"'satin' is not a valid option"):
+        deserialize(Paint, {"color": "red", "level": 2, "finish": "satin"})
+    with pytest.raises(ValueError):
+        deserialize(Paint, {"color": "yellow", "level": 2, "finish": "matte"})
+
+
+@pytest.mark.parametrize("ctx", (Trail(), empty))
+def test_deserialize_enums_in_dataclass_error_path(ctx):
+    data = [
+        {"color": "red", "level": 2, "finish": "gloss"},
+        {"color": "red", "level": 2, "finish": "satin"},
+    ]
+    with pytest.raises(ValidationError, match=r"At path .1.finish: 'satin' is not a valid"):
+        deserialize(list[Paint], data, ctx)
+
+
 ###############
 # Error tests #
 ###############
@@ -245,12 +300,55 @@ def test_deserialize_missing_field(ctx):
         deserialize(list[Point], pts, ctx)
 
 
+def test_trail_follow():
+    ctx = Trail()
+    one = ctx.follow(dict, {"a": [1]}, "a")
+    two = one.follow(list, [1], 0)
+    assert ctx.full_trail == () and ctx.trail == ()
+    assert one.trail == ("a",)
+    assert two.full_trail == ((dict, {"a": [1]}, "a"), (list, [1], 0))
+    assert two.trail == ("a", 0)
+    assert type(two) is Trail
+
+
+def test_trail_construct():
+    ctx = Trail(full_trail=((dict, {"a": 1}, "a"),))
+    assert ctx.trail == ("a",)
+    assert ctx.follow(int, 1, "b").trail == ("a", "b")
+    assert replace(ctx, full_trail=()).trail == ()
+    assert replace(ctx.follow(int, 1, "b")) == ctx.follow(int, 1, "b")
+    melded = ctx + WorkingDirectory(directory=Path("."))
+    assert melded.follow(int, 1, "b").trail == ("a", "b")
+
+
+def test_error_information_is_deferred(monkeypatch):
+    from serieux import exc
+
+    calls = []
+    extract = exc.extract_information
+    monkeypatch.setattr(exc, "extract_information", lambda *a: calls.append(a) or extract(*a))
+    with pytest.raises(ValidationError) as info:
+        deserialize(int, "foo")
+    assert calls == []
+    assert "Cannot deserialize" in str(info.value)
+    assert info.value.info.trail_string == "(at root)"
+    assert len(calls) == 1
+
+
 def test_deserialize_extra_fields_not_allowed():
     data = {"x": 1, "y": 2, "poop": 123}
     with pytest.raises(UnrecognizedFieldError, match=r"Extra unrecognized fields.*Point.*poop"):
         deserialize(Point, data)
 
 
+def test_deserialize_trusted():
+    assert deserialize(Point, {"x": 1, "y": 2}, Trusted()) == Point(1, 2)
+    # Extra fields and Literal options are not checked
+    assert deserialize(Point, {"x": 1, "y": 2, "poop": 123}, Trusted()) == Point(1, 2)
+    assert deserialize(Literal[1, 2, 7], 3, Trusted()) == 3
+    assert deserialize(list[Point], [{"x": 1, "y": 2}], Trusted()) == [Point(1, 2)]
+
+
 def test_deserialize_extra_fields_allowed():
     data = {"x": 1, "y": 2, "poop": 123}
     assert deserialize(AllowExtras[Point], data) == Point(1, 2)
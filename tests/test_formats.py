@@ -1,6 +1,26 @@
+from dataclasses import dataclass
+from pickle import PickleBuffer
+
 import pytest
 
-from serieux.formats import dump, dumps, load, loads
+from serieux import dump_stream, iter_load
+from serieux.ctx import Binary
+from serieux.exc import ValidationError
+from serieux.formats import (
+    FileSource,
+    ParseCache,
+    dump,
+    dump_iter,
+    dumps,
+    find,
+    load,
+    load_iter,
+    load_mapped,
+    loads,
+    parse_cache,
+)
+
+from .definitions import Point
 
 data = {
     "plums": 38,
@@ -10,6 +30,9 @@ data = {
 
 cases = [
     ("json", data),
+    ("jsonl", [data, data]),
+    ("msgpack", data),
+    ("mpk", data),
     ("pkl", data),
     ("yaml", data),
     ("toml", data),
@@ -27,6 +50,8 @@ def test_dump_and_load(tmp_path, suffix, value):
 
 str_cases = [
     ("json", data),
+    ("jsonl", [data, data]),
+    ("msgpack", data),
     ("yaml", data),
     ("toml", data),
     ("txt", "hello!"),
@@ -38,3 +63,187 @@ def test_dumps_and_loads(suffix, value):
     dumped = dumps(value, suffix)
     loaded = loads(dumped, suffix)
     assert loaded == value
+
+
+@pytest.mark.parametrize("suffix", ["jsonl", "json", "msgpack", "yaml"])
+def test_dump_and_load_iter(tmp_path, suffix):
+    file = tmp_path / f"test.{suffix}"
+    dump_iter(file, iter([data, data, data]))
+    assert list(load_iter(file)) == [data, data, data]
+
+
+def test_jsonl_skips_blank_lines(tmp_path):
+    file = tmp_path / "test.jsonl"
+    file.write_text('{"x": 1}\n\n{"x": 2}\n')
+    assert list(load_iter(file)) == [{"x": 1}, {"x": 2}]
+
+
+def test_iter_load_and_dump_stream(tmp_path):
+    file = tmp_path / "points.jsonl"
+    dump_stream(Point, (Point(i, i * 2) for i in range(5)), file)
+    assert file.read_text().count("\n") == 5
+    it = iter_load(Point, file)
+    assert next(it) == Point(0, 0)
+    assert list(it) == [Point(i, i * 2) for i in range(1, 5)]
+
+
+def test_stream_contexts(tmp_path):
+    seen = []
+
+    @dataclass
+    class Spy:
+        x: int
+
+        @classmethod
+        def serieux_deserialize(cls, obj, ctx, call_next):
+            seen.append(ctx)
+            return cls(x=obj["x"])
+
+        @classmethod
+        def serieux_serialize(cls, obj, ctx, call_next):
+            seen.append(ctx)
+            return {"x": obj.x}
+
+    for suffix in ("jsonl", "msgpack"):
+        file = tmp_path / f"spies.{suffix}"
+        seen.clear()
+        dump_stream(Spy, [Spy(1)], file)
+        assert list(iter_load(Spy, file)) == [Spy(1)]
+        dumped, loaded = seen
+        assert dumped.origin == loaded.origin == file
+        assert isinstance(dumped, Binary) == (suffix == "msgpack")
+        assert loaded.directory == tmp_path.absolute()
+
+
+def test_msgpack_stream(tmp_path):
+    file = tmp_path / "points.msgpack"
+    dump_stream(Point, (Point(i, i * 2) for i in range(5)), file)
+    assert list(iter_load(Point, file)) == [Point(i, i * 2) for i in range(5)]
+
+
+def test_msgpack_dump_and_load_iter(tmp_path):
+    file = tmp_path / "points.msgpack"
+    dump(file, [data, data])
+    assert list(load_iter(file)) == [data, data]
+
+
+def test_msgpack_dump_iter_and_load(tmp_path):
+    file = tmp_path / "points.msgpack"
+    dump_iter(file, iter([data, data]))
+    assert load(file) == [data, data]
+    dump_iter(file, iter([]))
+    assert load(file) == []
+
+
+def test_msgpack_extra_data(tmp_path):
+    file = tmp_path / "points.msgpack"
+    file.write_bytes(dumps([1], "msgpack") + dumps([2], "msgpack"))
+    with pytest.raises(ValidationError, match="more than one MessagePack object"):
+        list(load_iter(file))
+    with pytest.raises(ValidationError, match="more than one object"):
+        load(file)
+
+
+def test_msgpack_load_iter_not_array(tmp_path):
+    file = tmp_path / "points.msgpack"
+    dump(file, data)
+    with pytest.raises(ValidationError, match="does not contain a MessagePack array"):
+        list(load_iter(file))
+
+
+def test_msgpack_buffers():
+    fmt = find(None, "msgpack")
+    assert fmt.binary
+    dumped = fmt.dumps({"data": PickleBuffer(b"abc"), "x": 1})
+    # The packer's buffer is reused, but the result must not be affected
+    fmt.dumps({"data": b"zzzzzz"})
+    assert fmt.loads(dumped) == {"data": b"abc", "x": 1}
+
+
+def test_load_mapped(tmp_path):
+    file = tmp_path / "data.bin"
+    file.write_bytes(b"hello")
+    assert load_mapped(file, bytes) == b"hello"
+    empty = tmp_path / "empty.bin"
+    empty.write_bytes(b"")
+    assert load_mapped(empty, bytes) == b""
+
+
+def test_parse_cache(tmp_path):
+    cache = ParseCache(maxbytes=10)
+    file = tmp_path / "test.json"
+    other = tmp_path / "other.json"
+    file.write_text('{"x": 1}')
+    other.write_text('{"x": 2}')
+    fmt = find(file)
+    # Files are kept the second time they are parsed
+    assert cache.get(file, fmt, fmt.load) == {"x": 1}
+    assert cache.nbytes == 0
+    assert cache.get(file, fmt, fmt.load) == {"x": 1}
+    assert cache.nbytes == 8
+    assert cache.get(file, fmt, fmt.load) == {"x": 1}
+    assert (cache.hits, cache.misses) == (1, 2)
+    file.write_text('{"x": 10}')
+    assert cache.get(file, fmt, fmt.load) == {"x": 10}
+    assert cache.get(file, fmt, fmt.load) == {"x": 10}
+    # Keeping other evicts file, to stay under maxbytes
+    assert cache.get(other, fmt, fmt.load) == {"x": 2}
+    assert cache.get(other, fmt, fmt.load) == {"x": 2}
+    assert cache.nbytes == 8
+    assert cache.get(file, fmt, fmt.load) == {"x": 10}
+    assert (cache.hits, cache.misses) == (1, 7)
+
+
+def test_parse_cache_skips_large_files(tmp_path):
+    cache = ParseCache(max_file_size=4)
+    file = tmp_path / "test.json"
+    file.write_text('{"x": 1}')
+    fmt = find(file)
+    for _ in range(3):
+        assert cache.get(file, fmt, fmt.load) == {"x": 1}
+    assert (cache.hits, cache.misses, cache.nbytes) == (0, 0, 0)
+
+
+def test_parse_cache_first_load_not_copied(tmp_path):
+    cache = ParseCache()
+    file = tmp_path / "test.json"
+    file.write_text('{"x": 1}')
+    parsed = []
+
+    def parse(path):
+        parsed.append(find(path).load(path))
+        return parsed[-1]
+
+    assert cache.get(file, "json", parse) is parsed[0]
+    assert cache.get(file, "json", parse) is not parsed[1]
+
+
+def test_filesource_uses_parse_cache(tmp_path):
+    file = tmp_path / "point.yaml"
+    file.write_text("x: 1\ny: 2\n")
+    hits = parse_cache.hits
+    assert FileSource(file).load() == FileSource(file).load() == FileSource(file).load()
+    assert parse_cache.hits == hits + 1
+
+
+def test_parse_cache_returns_copies(tmp_path):
+    file = tmp_path / "point.yaml"
+    file.write_text("x: 1\nys: [2, 3]\n")
+    for _ in range(3):
+        data = FileSource(file).load()
+        assert data == {"x": 1, "ys": [2, 3]}
+        data["x"] = 10
+        data["ys"].append(4)
+
+
+def test_yaml_locate(tmp_path):
+    file = tmp_path / "config.yaml"
+    file.write_text("a:\n  b: 1\n  c: [x, y]\nd: 2\n")
+    fmt = find(file)
+    assert fmt.locate(file, ("a", "b")).linecols == ((1, 5), (1, 6))
+    assert fmt.locate(file, ("a", "c", 1)).linecols == ((2, 9), (2, 10))
+    assert fmt.locate(file, ["d"]).start == file.read_text().index("2")
+    # Missing entries are located at their closest ancestor
+    assert fmt.locate(file, ("a", "z")) == fmt.locate(file, ("a",))
+    # The index is built once and shared between lookups
+    assert fmt.locate(file, ("a", "b")) is fmt.locate(file, ("a", "b"))
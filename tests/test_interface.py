@@ -1,12 +1,28 @@
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+from typing import Literal
 
 import pytest
-from ovld import Medley
-
-from serieux import deserializer, get_deserializer, get_serializer, schema_definition, serializer
-from serieux.ctx import Context
+from ovld import Lambda, Medley, code_generator
+
+from serieux import (
+    Serieux,
+    TaggedUnion,
+    deserializer,
+    get_batch_deserializer,
+    get_batch_serializer,
+    get_deserializer,
+    get_serializer,
+    schema_definition,
+    serializer,
+)
+from serieux.codecache import LockedTypeMap
+from serieux.ctx import Context, EmptyContext, Sourced, WorkingDirectory
 from serieux.exc import ValidationError
-from tests.definitions import Point
+from tests.definitions import Citizen, Color, Country, Level, Point, Tree, World
 
 
 class Beep:
@@ -89,3 +105,110 @@ def test_deserializer_for():
     assert get_deserializer(list[Point])([{"x": 1, "y": 2}]) == [Point(1, 2)]
     assert get_deserializer(int)(42) == 42
     assert get_deserializer(date)("2025-12-01") == date(2025, 12, 1)
+
+
+def test_batch_serializer():
+    assert get_batch_serializer(Point)([Point(1, 2), Point(3, 4)]) == [
+        {"x": 1, "y": 2},
+        {"x": 3, "y": 4},
+    ]
+    assert get_batch_serializer(int)([1, 2, 3]) == [1, 2, 3]
+
+
+def test_batch_deserializer():
+    data = [{"x": 1, "y": 2}, {"x": 3, "y": 4}]
+    assert get_batch_deserializer(Point)(data) == [Point(1, 2), Point(3, 4)]
+    assert get_batch_deserializer(Point)(iter(data)) == [Point(1, 2), Point(3, 4)]
+    assert get_batch_deserializer(list[Point])([data]) == [[Point(1, 2), Point(3, 4)]]
+    assert get_batch_deserializer(date)(["2025-12-01"]) == [date(2025, 12, 1)]
+
+
+def test_batch_deserializer_dynamic_types():
+    assert get_batch_deserializer(int | str)([1, "a"]) == [1, "a"]
+    assert get_batch_deserializer(Literal["a", "b"])(["b", "a"]) == ["b", "a"]
+    assert get_batch_deserializer(Level)([2, 0]) == [Level.HI, Level.LO]
+    assert get_batch_deserializer(Color)(["red"]) == [Color.RED]
+    with pytest.raises(ValidationError):
+        get_batch_deserializer(Literal["a", "b"])(["c"])
+
+
+def test_batch_serializer_dynamic_types():
+    assert get_batch_serializer(int | str)([1, "a"]) == [1, "a"]
+    assert get_batch_serializer(Literal["a", "b"])(["b"]) == ["b"]
+    assert get_batch_serializer(Level)([Level.MED]) == [1]
+
+
+def test_batch_deserializer_invalid():
+    with pytest.raises(ValidationError):
+        get_batch_deserializer(Point)([{"x": 1, "y": 2}, "oops"])
+
+
+def test_precompile(fresh_serieux):
+    stats = fresh_serieux.precompile(World, TaggedUnion[Point, World])
+    assert {World, Country, Citizen, dict[str, Country], list[Citizen], Point} <= set(stats)
+    assert set(stats[World]) == {"model", "serialize", "deserialize", "schema"}
+    assert (type[Citizen], dict, EmptyContext) in fresh_serieux.deserialize.map
+    assert (type[Citizen], Citizen, EmptyContext) in fresh_serieux.serialize.map
+    assert (Country, EmptyContext) in fresh_serieux._schema_cache
+    assert fresh_serieux.deserialize(Point, {"x": 1, "y": 2}) == Point(1, 2)
+
+
+def test_precompile_context_instances(fresh_serieux, tmp_path):
+    stats = fresh_serieux.precompile(Point, ctx_types=[Sourced, WorkingDirectory(tmp_path)])
+    assert set(stats[Point]) == {"model", "serialize", "deserialize", "schema"}
+    assert (type[Point], dict, Sourced) in fresh_serieux.deserialize.map
+    assert (type[Point], dict, WorkingDirectory) in fresh_serieux.deserialize.map
+
+
+def test_precompile_directions(fresh_serieux):
+    stats = fresh_serieux.precompile(Tree, directions=["deserialize"])
+    assert set(stats[Tree]) == {"model", "deserialize"}
+    assert (type[Tree], dict, EmptyContext) in fresh_serieux.deserialize.map
+
+
+def test_concurrent_deserialize(fresh_serieux):
+    data = {"x": 1, "y": 2}
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(lambda _: fresh_serieux.deserialize(Point, data), range(100)))
+    assert results == [Point(1, 2)] * 100
+    assert (type[Point], dict, EmptyContext) in fresh_serieux.deserialize.map
+    assert isinstance(fresh_serieux.deserialize.map, LockedTypeMap)
+
+
+def test_construction_locks_per_type():
+    started = threading.Event()
+    release = threading.Event()
+
+    class Slow:
+        pass
+
+    class SlowFeature(Medley):
+        @code_generator
+        def deserialize(self, t: type[Slow], obj: dict, ctx: Context, /):
+            started.set()
+            assert release.wait(5)
+            return Lambda("$t()")
+
+    srx = (Serieux + SlowFeature)()
+    with ThreadPoolExecutor(2) as pool:
+        slow = pool.submit(srx.deserialize, Slow, {})
+        assert started.wait(5)
+        # Code can be generated for another type while Slow's is being generated
+        fast = pool.submit(srx.deserialize, Point, {"x": 1, "y": 2})
+        assert fast.result(timeout=5) == Point(1, 2)
+        release.set()
+        assert isinstance(slow.result(timeout=5), Slow)
+
+
+def test_lazy_imports():
+    code = """if True:
+        import sys
+        import serieux
+        assert "serieux.features.clargs" not in sys.modules
+        assert "importlib.metadata" not in sys.modules
+        from serieux import Columnar, deserialize
+        assert "serieux.features.columnar" in sys.modules
+        assert deserialize(int, 1) == 1
+        assert "numpy" not in sys.modules
+    """
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -1,12 +1,14 @@
+import inspect
 import re
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from pathlib import Path
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 import pytest
 
-from serieux import JSON, deserialize, serialize
-from serieux.ctx import WorkingDirectory
+from serieux import JSON, deserialize, serialize, serieux
+from serieux.ctx import EmptyContext, Trail, WorkingDirectory
 from serieux.exc import ValidationError
 from serieux.tell import tells
 
@@ -243,6 +245,76 @@ def test_tells_pattern():
     assert tells(re.Pattern, str) == set()
 
 
+#####################
+# Test inlined code #
+#####################
+
+
+@dataclass
+class Reading:
+    when: datetime
+    day: date
+    duration: timedelta
+    tz: ZoneInfo
+    log: Path
+
+
+reading = Reading(
+    when=datetime(2024, 3, 1, 12, 30),
+    day=date(2024, 3, 1),
+    duration=timedelta(seconds=90),
+    tz=ZoneInfo("UTC"),
+    log=Path("logs/reading.txt"),
+)
+
+reading_data = {
+    "when": "2024-03-01T12:30:00",
+    "day": "2024-03-01",
+    "duration": "90s",
+    "tz": "UTC",
+    "log": "logs/reading.txt",
+}
+
+
+def test_serialize_inlined_fields():
+    assert serialize(Reading, reading) == reading_data
+    ctx = WorkingDirectory(directory=Path("logs"))
+    assert serialize(Reading, reading, ctx)["log"] == "reading.txt"
+
+
+def test_serialize_path_in_working_directory_not_inlined():
+    # The code for Paths relative to a WorkingDirectory is a Def, so the enclosing
+    # code goes through the dispatch map for that field
+    fn = serieux.serialize.resolve(type[Reading], Reading, WorkingDirectory)
+    (line,) = [ln for ln in inspect.getsource(fn).splitlines() if "'log'" in ln]
+    assert "method_map[" in line
+    fn = serieux.serialize.resolve(type[Reading], Reading, EmptyContext)
+    (line,) = [ln for ln in inspect.getsource(fn).splitlines() if "'log'" in ln]
+    assert "method_map[" not in line
+
+
+@pytest.mark.parametrize("trail", [True, False])
+def test_serialize_path_outside_working_directory(trail):
+    ctx = WorkingDirectory(directory=Path("data"))
+    if trail:
+        ctx = Trail() + ctx
+    with pytest.raises(ValidationError, match=r"At path .log: ValueError"):
+        serialize(Reading, reading, ctx)
+
+
+def test_deserialize_inlined_fields():
+    assert deserialize(Reading, reading_data) == reading
+    ctx = WorkingDirectory(directory=Path("data"))
+    assert deserialize(Reading, reading_data, ctx).log == Path("data/logs/reading.txt")
+    assert deserialize(Reading, {**reading_data, "when": 0}).when == datetime.fromtimestamp(0)
+    with pytest.raises(ValidationError, match="is not a valid timedelta"):
+        deserialize(Reading, {**reading_data, "duration": "1dd"})
+
+
+def test_deserialize_zoneinfo_memoized():
+    assert deserialize(ZoneInfo, "America/New_York") is deserialize(ZoneInfo, "America/New_York")
+
+
 #############
 # Test JSON #
 #############